@@ -0,0 +1,1754 @@
+#=== Silhouette Geometry Kernel ===
+#Turns silhouette outlines into surface meshes, working only on plain
+#arrays. Nothing here needs bpy or mathutils, so the generator can be run,
+#profiled and farmed out without Blender. ShadowShapes reads the
+#silhouettes out of Blender and writes the surfaces back in.
+
+from bisect import bisect_left, bisect_right, insort
+from math import floor
+from array import array
+from collections import deque, Counter
+import multiprocessing
+import sys
+from .Weld import weld, weldCandidates, weldFaces
+
+ERROR_T = 0.000001
+MERGE_T = 0.001
+
+#Rotations lining the later passes up with the first, as the
+#(source axis, sign) of each axis
+SURFACE2_AXES = ((2, 1), (1, 1), (0, 1))
+SURFACE3_AXES = ((2, 1), (0, -1), (1, -1))
+
+#Suffixes of the grid states kept for a generator, one per pass
+PASS_SUFFIXES = ("Surface", "Surface2")
+
+#Rows per band of the grid, on average
+BAND_ROWS = 16
+
+
+# ---- Mesh Buffers ----
+def arrayBytes(*buffers):
+    return sum(buffer.itemsize*len(buffer) for buffer in buffers)
+
+def objectBytes(table):
+    "Rough bytes of a dict holding small keys and values"
+    return sys.getsizeof(table) + sum(sys.getsizeof(key) + sys.getsizeof(value)
+                                      for key, value in table.items())
+
+def orientFaces(coords, loops, loopStart, loopTotal):
+    """Return loops with the faces of each connected patch wound alike
+    
+    Winding spreads breadth first across edges shared by exactly two faces,
+    then any patch enclosing negative signed volume is turned inside out"""
+    faceCount = len(loopStart)
+    oriented = array('i', loops)
+    
+    #Plain lists index faster than arrays
+    loops = loops.tolist()
+    xs = coords[0::3].tolist()
+    ys = coords[1::3].tolist()
+    zs = coords[2::3].tolist()
+    loopCount = len(loops)
+    
+    #The vertex each loop runs to, and the face it belongs to
+    ends = loops[1:] + loops[:1]
+    for start, total in zip(loopStart, loopTotal):
+        ends[start+total-1] = loops[start]
+    loopFace = array('i')
+    for f, total in enumerate(loopTotal):
+        loopFace.extend([f] * total)
+    
+    #Every edge packed once into a (low, high) key, as EdgeSet does
+    upward = [a < b for a, b in zip(loops, ends)]
+    keys = [(a << 32) | b if a < b else (b << 32) | a for a, b in zip(loops, ends)]
+    
+    #Winding only spreads across edges with exactly two loops, as Blender's
+    #normals_make_consistent does. Border and non-manifold edges keep -1
+    firsts = dict(zip(reversed(keys), range(loopCount-1, -1, -1)))
+    lasts = dict(zip(keys, range(loopCount)))
+    counts = Counter(keys)
+    other = [-1] * loopCount
+    for l, key in enumerate(keys):
+        if counts[key] == 2:
+            other[l] = lasts[key] if firsts[key] == l else firsts[key]
+    
+    flip = [None] * faceCount
+    for seed in range(faceCount):
+        if flip[seed] != None:
+            continue
+        
+        flip[seed] = False
+        patch = [seed]
+        queue = deque(patch)
+        while queue:
+            f = queue.popleft()
+            start = loopStart[f]
+            flipped = flip[f]
+            for l in range(start, start + loopTotal[f]):
+                m = other[l]
+                if m < 0:
+                    continue
+                g = loopFace[m]
+                if flip[g] == None:
+                    #The neighbour must run the other way along the edge
+                    flip[g] = (upward[m] == upward[l]) != flipped
+                    patch.append(g)
+                    queue.append(g)
+        
+        #Signed volume of the fan triangles against the origin
+        volume = 0.0
+        for f in patch:
+            start = loopStart[f]
+            face = loops[start:start + loopTotal[f]]
+            if flip[f]:
+                face.reverse()
+            v0 = face[0]
+            x0, y0, z0 = xs[v0], ys[v0], zs[v0]
+            for k in range(1, len(face)-1):
+                v1 = face[k]
+                v2 = face[k+1]
+                x1, y1, z1 = xs[v1], ys[v1], zs[v1]
+                x2, y2, z2 = xs[v2], ys[v2], zs[v2]
+                volume += x0*(y1*z2 - z1*y2) + y0*(z1*x2 - x1*z2) + z0*(x1*y2 - y1*x2)
+        
+        if volume < 0:
+            for f in patch:
+                flip[f] = not flip[f]
+    
+    for f in range(faceCount):
+        if flip[f]:
+            start = loopStart[f]
+            oriented[start:start + loopTotal[f]] = array('i', reversed(loops[start:start + loopTotal[f]]))
+    return oriented
+
+class MeshBuffers:
+    "Vertex coords and face loops as flat arrays, laid out the way foreach_set takes them"
+    def __init__(self):
+        self.coords = array('f')
+        self.loops = array('i')
+        self.loopStart = array('i')
+        self.loopTotal = array('i')
+    
+    def __repr__(self):
+        return "<MeshBuffers " + str(self.vertCount()) + " verts, " + \
+               str(self.faceCount()) + " faces>"
+    
+    def vertCount(self):
+        return len(self.coords) // 3
+    
+    def faceCount(self):
+        return len(self.loopStart)
+    
+    def addVerts(self, coords):
+        "Append flat x, y, z coords"
+        self.coords.fromlist(coords.tolist())
+    
+    def addFace(self, face):
+        self.loopStart.append(len(self.loops))
+        self.loopTotal.append(len(face))
+        self.loops.extend(face)
+    
+    def addFaces(self, loops, loopTotal):
+        "Append faces given as flat loops and the size of each"
+        start = len(self.loops)
+        for total in loopTotal:
+            self.loopStart.append(start)
+            start += total
+        self.loopTotal.extend(loopTotal)
+        self.loops.extend(loops)
+    
+    def verts(self):
+        "The coords as [x, y, z] lists"
+        coords = self.coords
+        return [coords[k:k+3].tolist() for k in range(0, len(coords), 3)]
+    
+    def faces(self):
+        "The vertex indices of every face as lists"
+        loops = self.loops
+        return [loops[start:start+total].tolist()
+                for start, total in zip(self.loopStart, self.loopTotal)]
+    
+    def permuted(self, axes):
+        "A copy with axis k of every vertex taken from axes[k], a (source axis, sign)"
+        buffers = MeshBuffers()
+        coords = array('f', [0.0]) * len(self.coords)
+        for k, (source, sign) in enumerate(axes):
+            values = self.coords[source::3]
+            if sign < 0:
+                values = array('f', [-c for c in values])
+            coords[k::3] = values
+        
+        buffers.coords = coords
+        buffers.loops = array('i', self.loops)
+        buffers.loopStart = array('i', self.loopStart)
+        buffers.loopTotal = array('i', self.loopTotal)
+        return buffers
+    
+    def extend(self, other):
+        "Append other's verts and faces after ours"
+        vertOffset = self.vertCount()
+        loopOffset = len(self.loops)
+        
+        self.coords.extend(other.coords)
+        self.loops.extend(array('i', [v + vertOffset for v in other.loops]))
+        self.loopStart.extend(array('i', [start + loopOffset for start in other.loopStart]))
+        self.loopTotal.extend(other.loopTotal)
+    
+    def welded(self, threshold):
+        "A copy with vertices closer than threshold merged, as by remove_doubles"
+        buffers = MeshBuffers()
+        buffers.coords, buffers.loops, buffers.loopStart, buffers.loopTotal = \
+            weld(self.coords, self.loops, self.loopStart, self.loopTotal, threshold,
+                 weldCandidates(self.coords, threshold))
+        return buffers
+    
+    def oriented(self):
+        "A copy with every face wound outward, as by normals_make_consistent"
+        buffers = MeshBuffers()
+        buffers.coords = array('f', self.coords)
+        buffers.loops = orientFaces(self.coords, self.loops, self.loopStart, self.loopTotal)
+        buffers.loopStart = array('i', self.loopStart)
+        buffers.loopTotal = array('i', self.loopTotal)
+        return buffers
+    
+    def nbytes(self):
+        return arrayBytes(self.coords, self.loops, self.loopStart, self.loopTotal)
+
+class SeamIndex:
+    """One vertex buffer that several surfaces are stitched into
+    
+    Both passes place rim vertices at the same grid positions, so a vertex
+    already emitted at a position is shared by index instead of copied"""
+    def __init__(self):
+        self.buffers = MeshBuffers()
+        self.index = {}
+    
+    def __repr__(self):
+        return "<SeamIndex " + str(self.buffers.vertCount()) + " verts>"
+    
+    def add(self, buffers):
+        "Stitch in buffers, remapping its vertices through the shared index"
+        mesh = self.buffers
+        index = self.index
+        coords = buffers.coords
+        
+        #New positions get the next index, in order of first appearance
+        fresh = len(index)
+        remap = array('i', [index.setdefault(co, len(index)) for co in
+                            zip(coords[0::3], coords[1::3], coords[2::3])])
+        for v, shared in enumerate(remap):
+            if shared == fresh:
+                mesh.coords.extend(coords[3*v:3*v+3])
+                fresh += 1
+        
+        loops, loopStart, loopTotal = weldFaces(remap, buffers.loops,
+                                                buffers.loopStart, buffers.loopTotal)
+        loopOffset = len(mesh.loops)
+        mesh.loops.extend(loops)
+        mesh.loopStart.extend(array('i', [start + loopOffset for start in loopStart]))
+        mesh.loopTotal.extend(loopTotal)
+    
+    def stitched(self, threshold):
+        """The stitched buffers, with any distinct vertices closer than
+        threshold still merged as by remove_doubles"""
+        mesh = self.buffers
+        candidates = weldCandidates(mesh.coords, threshold)
+        if not candidates:
+            return mesh
+        
+        buffers = MeshBuffers()
+        buffers.coords, buffers.loops, buffers.loopStart, buffers.loopTotal = \
+            weld(mesh.coords, mesh.loops, mesh.loopStart, mesh.loopTotal, threshold, candidates)
+        return buffers
+
+
+# ---- Surfaces ----
+def silhouetteArrays(silhouette):
+    "The coords and edges of a Silhouette"
+    return silhouette.coords, silhouette.edges
+
+class GeometryBuilder:
+    """The surface generator, on Silhouettes or on whatever reader can read
+    
+    Mixed into the Blender operator, which plugs in a reader for objects"""
+    reader = staticmethod(silhouetteArrays)
+    
+    def buildSurfaces(self, silX, silY, silZ=None, name="", memo=None,
+                      workers=1, concurrent=False):
+        """Generate the surfaces of the silhouettes seen along X, Y and
+        optionally Z, as (suffix, MeshBuffers) pairs lined up with each other"""
+        if memo == None:
+            memo = ScanlineMemo(self.reader)
+        sy  = silX
+        sx  = silY
+        sz  = silZ
+        
+        #The passes only meet once their meshes are joined. The Third Surface
+        #is made from the second pass, so the Z silhouette is never scanned
+        passes = [(sx, sy, name+PASS_SUFFIXES[0]), (sy, sx, name+PASS_SUFFIXES[1])]
+        geometry = self.runPasses(passes, memo, workers, concurrent)
+        
+        # === Generate First surface ===
+        mesh, edges = geometry[0]
+        
+        # === Generate Second Surface ===
+        mesh2, edges2 = geometry[1]
+        
+        #Line the Second Surface up and stitch both into one buffer,
+        #sharing the rim vertices instead of removing doubles
+        seams = SeamIndex()
+        seams.add(mesh)
+        seams.add(mesh2.permuted(SURFACE2_AXES))
+        
+        #Fix Normals
+        surfaces = [("Surface", seams.stitched(MERGE_T).oriented())]
+        
+        if sz:
+            #Rotated, without doubles and with consistent normals
+            seams = SeamIndex()
+            seams.add(mesh2.permuted(SURFACE3_AXES))
+            surfaces.append(("Surface3", seams.stitched(MERGE_T).oriented()))
+        
+        return surfaces
+    
+    def runPasses(self, passes, memo, workers, concurrent):
+        "getGeometry of every (sx, sy, surface name) pass, side by side if concurrent"
+        pool = None
+        if concurrent and len(passes) > 1:
+            pool = workerPool(max(workers, len(passes)))
+        
+        #addMesh only takes faces, so edges are never stitched
+        if not pool:
+            return [self.getGeometry(sx, sy, gridState(surface), memo, workers, False)
+                    for sx, sy, surface in passes]
+        
+        #Workers only see snapshots, and hand back the updated grid states
+        jobs = [(memo.snapshot(sx), memo.snapshot(sy), gridState(surface))
+                for sx, sy, surface in passes]
+        results = pool.map(buildPass, jobs)
+        
+        geometry = []
+        for (sx, sy, surface), (mesh, edges, state) in zip(passes, results):
+            gridStates[surface] = state
+            geometry.append((mesh, edges))
+        return geometry
+    
+    def getGeometry(self, sx, sy, state=None, memo=None, workers=1, withEdges=True):
+        """Build one surface, reusing whatever bands of columns and gaps of state are unchanged
+        
+        Returns MeshBuffers and the edges as a flat array of vertex pairs,
+        or None without withEdges"""
+        if state == None:
+            state = GridState()
+        if memo == None:
+            memo = ScanlineMemo(self.reader)
+        state.begin()
+        
+        mesh = MeshBuffers()
+        edges = EdgeSet()
+        
+        #Silhouette coordinates and edges as plain lists
+        coordsX, edgesX = memo.arrays(sx)
+        coordsY, edgesY = memo.arrays(sy)
+        
+        #Generate Initial Grid markings
+        xgrid, ygrid = self.findXYGrid([coordsX, coordsY])
+        xvals = xgrid.vals
+        yvals = ygrid.vals
+        
+        xext, yext = self.findExtraGridMarkings(coordsY, edgesY, sx,
+                                                xgrid, ygrid, memo)
+        
+        xsize = len(xvals)
+        ysize = len(yvals)
+        
+        #Hits of both silhouettes on every column at once, the other
+        #pass scans the same columns with the silhouettes swapped
+        hitsX = memo.hits(sx, xvals)
+        hitsY = memo.hits(sy, xvals)
+        
+        #Extra markings lie on a column, or in the gap after one
+        columnExtras = [[] for i in range(xsize)]
+        for x, ys in xext.items():
+            i = xgrid.index(x)
+            columnExtras[i] += ys
+        
+        gapExtras = [[] for i in range(xsize)]
+        for y, lines in yext.items():
+            for x, hits in lines:
+                i = xgrid.after(x) - 1
+                gapExtras[i].append((x, y, hits))
+        
+        insides = self.findInsideGrid(hitsY, yvals)
+        
+        #Each column is split into bands of rows, as is each gap. A row
+        #added or removed only changes the band it falls in
+        bands = self.findBands(yvals)
+        rowBands = [[] for j in range(ysize)]
+        for k, (low, high) in enumerate(bands):
+            for j in range(low, high+1):
+                rowBands[j].append(k)
+        
+        #The band holding the square under row j
+        squareBands = [0] + [rowBands[j][-1] for j in range(ysize-1)] + [len(bands)-1]
+        
+        #A band of a column only depends on the column's hits and its own
+        #rows, so unchanged bands keep their old key
+        columnKeys = []
+        columnExtraBands = []
+        for i in range(xsize):
+            inList = insides[i]
+            
+            rows = [[] for band in bands]
+            for j in range(ysize):
+                if inList[j] or (j > 0 and inList[j-1]) or \
+                   (j < ysize-1 and inList[j+1]):
+                    for k in rowBands[j]:
+                        rows[k].append((yvals[j], inList[j]))
+            
+            extras = [[] for band in bands]
+            extraBands = []
+            for y in columnExtras[i]:
+                afterYIndex = ygrid.after(y)
+                beforeYIndex = afterYIndex - 1
+                afterY = None
+                beforeY = None
+                if afterYIndex < ysize and inList[afterYIndex]:
+                    afterY = yvals[afterYIndex]
+                if beforeYIndex >= 0 and inList[beforeYIndex]:
+                    beforeY = yvals[beforeYIndex]
+                k = squareBands[afterYIndex]
+                extras[k].append((y, afterY, beforeY))
+                extraBands.append(k)
+            
+            #Units built for a surface without edges never collect them
+            columnKeys.append([(xvals[i], hitsX[i], tuple(rows[k]), tuple(extras[k]), withEdges)
+                               for k in range(len(bands))])
+            columnExtraBands.append(extraBands)
+        
+        #Extras on a band's top row sit in the band above as well
+        gapKeys = []
+        gapExtraBands = []
+        for i in range(xsize):
+            extras = [[] for band in bands]
+            extraBands = []
+            for extra in gapExtras[i]:
+                inBands = rowBands[ygrid.index(extra[1])]
+                for k in inBands:
+                    extras[k].append(extra)
+                extraBands.append(inBands)
+            
+            keys = []
+            for k in range(len(bands)):
+                eastKey = None
+                if i != xsize-1:
+                    eastKey = columnKeys[i+1][k]
+                keys.append((columnKeys[i][k], eastKey, tuple(extras[k])))
+            gapKeys.append(keys)
+            gapExtraBands.append(extraBands)
+        
+        if workers > 1:
+            self.buildStrips(state, columnKeys, gapKeys, workers)
+        
+        columns = []
+        for keys in columnKeys:
+            line = state.line(keys[0][:2], self.buildLine)
+            columns.append([state.column(key, self.buildColumn, line) for key in keys])
+        
+        gaps = []
+        for i in range(xsize):
+            east = [None] * len(bands)
+            if i != xsize-1:
+                east = columns[i+1]
+            gaps.append([state.gap(gapKeys[i][k], self.buildGap, columns[i][k], east[k])
+                         for k in range(len(bands))])
+        
+        state.end()
+        
+        #Stitch the bands together, numbering verts as one unbanded grid would
+        remaps = [self.stitchColumn(mesh, edges, columns[i], columnExtraBands[i])
+                  for i in range(xsize)]
+        for i in range(xsize):
+            east = [array('i')] * len(bands)
+            if i != xsize-1:
+                east = remaps[i+1]
+            self.stitchGap(mesh, edges, gaps[i], remaps[i], east, gapExtras[i],
+                           gapExtraBands[i])
+        
+        #Finished
+        if not withEdges:
+            return mesh, None
+        return mesh, edges.flat
+    
+    def findBands(self, yvals):
+        """(low, high) row indices of each band, neighbouring bands sharing
+        a row. Bands end on rows picked by their y alone, so they stay put
+        while rows elsewhere come and go"""
+        #Knuth's multiplicative hash of y in steps of ERROR_T picks them
+        ends = [j for j in range(len(yvals)) if j == 0 or j == len(yvals)-1 or
+                (int(yvals[j] / ERROR_T) * 2654435761 >> 16) % BAND_ROWS == 0]
+        return list(zip(ends, ends[1:])) or [(0, len(yvals)-1)]
+    
+    def stitchColumn(self, mesh, edges, bands, extraBands):
+        """Add the verts and edges of one column's bands to mesh. Returns
+        an array per band mapping its indices to the mesh's"""
+        count = len(bands[0].line.ids)
+        base = mesh.vertCount()
+        
+        #Cells first, each band's top row being the bottom of the next
+        remaps = []
+        starts = []
+        for k in range(len(bands)):
+            band = bands[k]
+            rows = band.key[2]
+            cellVerts = len(band.cells) * count
+            remaps.append(array('i', range(base, base + cellVerts)) +
+                          array('i', [0]) * (band.size - cellVerts))
+            starts.append(cellVerts)
+            
+            if k < len(bands)-1 and rows and rows[-1][1] and \
+               rows[-1] == bands[k+1].key[2][0]:
+                cellVerts -= count
+            mesh.addVerts(band.verts[:3*cellVerts])
+            base += cellVerts
+        
+        #Then the extra verts, in the order the unbanded column had them
+        for k in extraBands:
+            start = starts[k]
+            remaps[k][start:start + count] = array('i', range(base, base + count))
+            mesh.addVerts(bands[k].verts[3*start:3*(start + count)])
+            starts[k] += count
+            base += count
+        
+        for k in range(len(bands)):
+            remap = remaps[k]
+            for a, b in bands[k].edges.pairs():
+                edges.add(remap[a], remap[b])
+        return remaps
+    
+    def stitchGap(self, mesh, edges, bands, westRemaps, eastRemaps, extras, extraBands):
+        "Add the extra verts, edges and faces of one gap's bands to mesh"
+        base = mesh.vertCount()
+        remaps = []
+        starts = []
+        for band in bands:
+            remaps.append(array('i', [0]) * (len(band.verts) // 3))
+            starts.append(0)
+        
+        #An extra on a shared row is added once, the bands above and below
+        #both pointing at it
+        for (x, y, hits), inBands in zip(extras, extraBands):
+            start = starts[inBands[0]]
+            mesh.addVerts(bands[inBands[0]].verts[3*start:3*(start + len(hits))])
+            for k in inBands:
+                remaps[k][starts[k]:starts[k] + len(hits)] = \
+                    array('i', range(base, base + len(hits)))
+                starts[k] += len(hits)
+            base += len(hits)
+        
+        for k in range(len(bands)):
+            band = bands[k]
+            remap = westRemaps[k] + eastRemaps[k] + remaps[k]
+            for a, b in band.edges.pairs():
+                edges.add(remap[a], remap[b])
+            mesh.addFaces(array('i', [remap[v] for v in band.faces.loops]),
+                          band.faces.loopTotal)
+    
+    def buildStrips(self, state, columnKeys, gapKeys, workers):
+        "Build the missing column and gap bands of state in strips, on a worker pool"
+        #Without one getGeometry builds them all in place
+        pool = workerPool(workers)
+        if not pool:
+            return
+        
+        #Keys of each band, west to east
+        bandColumnKeys = list(zip(*columnKeys))
+        bandGapKeys = list(zip(*gapKeys))
+        
+        missing = [(k, i) for k in range(len(bandGapKeys)) for i in range(len(gapKeys))
+                   if state.needsColumn(columnKeys[i][k]) or state.needsGap(gapKeys[i][k])]
+        if not missing:
+            return
+        
+        #Split runs of missing indices along a band into strips of at most
+        #size, each also carrying the column east of its last gap
+        size = max(1, -(-len(missing) // (workers * 4)))
+        bounds = []
+        for k, i in missing:
+            if bounds and bounds[-1][0] == k and bounds[-1][2] == i and \
+               i - bounds[-1][1] < size:
+                bounds[-1][2] = i + 1
+            else:
+                bounds.append([k, i, i + 1])
+        
+        strips = [(bandColumnKeys[k][a:b+1], bandGapKeys[k][a:b]) for k, a, b in bounds]
+        
+        #map keeps strip order, and every unit lands at its own index
+        for (k, a, b), (columns, gaps) in zip(bounds, pool.map(buildStrip, strips)):
+            for i in range(a, b):
+                state.addColumn(columnKeys[i][k], columns[i-a])
+                state.addGap(gapKeys[i][k], gaps[i-a])
+    
+    def buildLine(self, key):
+        "The intersects of a column, shared by all its bands"
+        x, hits = key
+        return IntersectLine(IntersectStore(), hits, None, x)
+    
+    def buildColumn(self, key, line=None):
+        "Emit the cells and vertical links of one band of a column"
+        x, hits, rows, extras, withEdges = key
+        
+        column = GridColumn(key, edgeSink(withEdges))
+        if line == None:
+            line = self.buildLine((x, hits))
+        store = line.store
+        column.line = line
+        
+        #Generate Vertices
+        cells = {}
+        index = 0
+        for y, inside in rows:
+            if inside:
+                cells[y] = GridCell(line, y, index)
+                column.cells[y] = index
+                for k in line.ids:
+                    column.verts.extend((store.hit[k], x, y))
+                    index += 1
+        
+        #Connect Edges
+        for r in range(len(rows)-1):
+            if rows[r][1] and rows[r+1][1]:
+                v11 = cells[rows[r][0]]
+                v12 = cells[rows[r+1][0]]
+                for node, k in v11.nodes():
+                    matches = v12.findConnected(store, k, v11.y)
+                    for match in matches:
+                        column.links.extend((node, match))
+                        column.edges.add(match, node)
+        
+        #Connect Edges to Extra Verts.
+        for y, afterY, beforeY in extras:
+            lineNodes = range(index, index + len(line.ids))
+            for k in line.ids:
+                column.verts.extend((store.hit[k], x, y))
+                index += 1
+            
+            if afterY != None:
+                afterLine = cells[afterY]
+                for node, k in zip(lineNodes, line.ids):
+                    matches = afterLine.findConnected(store, k, y)
+                    for match in matches:
+                        column.links.extend((node, match))
+                        column.edges.add(match, node)
+            
+            if beforeY != None:
+                beforeLine = cells[beforeY]
+                for node, k in zip(lineNodes, line.ids):
+                    matches = beforeLine.findConnected(store, k, y)
+                    for match in matches:
+                        column.links.extend((match, node))
+                        column.edges.add(match, node)
+        
+        column.size = index
+        return column
+    
+    def buildGap(self, key, west, east):
+        "Emit the horizontal links and faces of one band between west and its east neighbour"
+        extras = key[2]
+        withEdges = key[0][4]
+        
+        gap = GridGap(key, west.size, east and east.size or 0, edgeSink(withEdges))
+        links = GridLinks()
+        
+        #Number west, then east, then our own extra verts
+        westCells = west.shiftCells(0)
+        west.addLinks(links, 0)
+        eastCells = {}
+        if east:
+            eastCells = east.shiftCells(west.size)
+            east.addLinks(links, west.size)
+        
+        #Connect Edges
+        for y in sorted(westCells):
+            v11 = westCells[y]
+            if y in eastCells:
+                v21 = eastCells[y]
+                for node, k in v11.nodes():
+                    matches = v21.findConnected(west.line.store, k, y)
+                    links.plusX.add(node, matches)
+                    for match in matches:
+                        gap.edges.add(match, node)
+                        links.minusX.link(match, node)
+        
+        #Connect Edges to Extra Verts.
+        store = IntersectStore()
+        index = gap.westSize + gap.eastSize
+        for x, y, hits in extras:
+            line = IntersectLine(store, hits, None, x)
+            line.setY(None, y)
+            
+            lineNodes = range(index, index + len(line.ids))
+            for k in line.ids:
+                gap.verts.extend((store.hit[k], x, y))
+                index += 1
+            
+            if y in eastCells:
+                afterLine = eastCells[y]
+                for node, k in zip(lineNodes, line.ids):
+                    matches = afterLine.findConnected(store, k, y)
+                    links.plusX.add(node, matches)
+                    for match in matches:
+                        gap.edges.add(match, node)
+                        links.minusX.link(match, node)
+            
+            #Past the last column there is nothing to sit between
+            if east and y in westCells:
+                beforeLine = westCells[y]
+                for node, k in zip(lineNodes, line.ids):
+                    matches = beforeLine.findConnected(store, k, y)
+                    links.minusX.add(node, matches)
+                    for match in matches:
+                        gap.edges.add(match, node)
+                        links.plusX.link(match, node)
+        
+        links.finish(index)
+        
+        #Generate Faces
+        if east:
+            ys = sorted(set(west.rowYs()) | set(east.rowYs()))
+            self.detectFaces(gap.faces, westCells, eastCells, ys, gap.edges, links)
+        
+        return gap
+    
+    def findExtraGridMarkings(self, coords, edges, ob2, xgrid, ygrid, memo):
+        
+        xExtra = {}
+        yExtra = {}
+        
+        #Crossings are found edge by edge, the lines through them are
+        #then scanned against ob2 in one batch
+        xCross = []
+        yCross = []
+        
+        for vert1, vert2 in edges:
+            x1, y1 = coords[vert1]
+            x2, y2 = coords[vert2]
+            
+            #Only the grid lines strictly inside the edge's extent can cross it
+            for x in xgrid.strictlyBetween(min(x1, x2), max(x1, x2)):
+                hit = (y2-y1)*(x- x1)/(x2-x1) + y1
+                xCross.append((x, hit))
+                    
+            for y in ygrid.strictlyBetween(min(y1, y2), max(y1, y2)):
+                hit = (x2-x1)*(y- y1)/(y2-y1) + x1
+                yCross.append((hit, y))
+        
+        #Lines on a grid column share that column's hits
+        for x, hit in xCross:
+            if x in xExtra:
+                xExtra[x].append(hit)
+            else:
+                xExtra[x] = [hit]
+        
+        hits = memo.hits(ob2, [x for x, y in yCross])
+        for k in range(len(yCross)):
+            x, y = yCross[k]
+            if y in yExtra:
+                yExtra[y].append((x, hits[k]))
+            else:
+                yExtra[y] = [(x, hits[k])]
+                
+        return xExtra, yExtra
+    
+    def removeDoubles(self, list):
+        return Lattice(list).vals
+    
+    def detectFaces(self, faces, westCells, eastCells, ys, edges, links):
+        "Add the faces of every square between two columns to faces"
+        #Plain rows are read without a call per lookup
+        links = links.rows()
+        for r in range(len(ys)-1):
+            self.detectFaceForSquare(faces,
+                                     westCells.get(ys[r]),    #sw
+                                     eastCells.get(ys[r+1]),  #ne
+                                     eastCells.get(ys[r]),    #se
+                                     westCells.get(ys[r+1]),  #nw
+                                     edges, links)
+    
+    #Not a marching-squares case table: over the test shapes 37% of the
+    #intersects a square starts from have a link with several targets,
+    #which the walk below fans out over and a fixed table of templates
+    #can't express. Without numpy there is nothing to vectorise either
+    def detectFaceForSquare(self, faces, swProjection, neProjection, seProjection, nwProjection, edges, links):
+        #Starting With the bottom left corner of the square
+        if swProjection:
+            for sw in swProjection.indices():
+                
+                #Search North over ALL 
+                if links.plusY[sw]:
+                    for nw in links.plusY[sw]:
+                        #Search East over ALL
+                        if links.plusX[nw]:
+                            for ne in links.plusX[nw]:
+                                
+                                #Search South over FIRST
+                                if links.minusY[ne]:
+                                    for se in links.minusY[ne]:
+                                        #Make 
+                                        faces.add(sw, nw, ne, se)
+                                        edges.add(sw, 
+                                                  se)
+                                    
+                                    
+                                    if links.plusX[sw]:
+                                        for se2 in links.plusX[sw]:
+                                            if se2 != se:
+                                                faces.add(se, sw, se2)
+                                                edges.add(se, 
+                                                          se2)
+                                        
+                                #Search North over ALL 
+                                elif links.plusX[sw]:
+                                    for se in links.plusX[sw]:
+                                        faces.add(sw, nw, ne, se)
+                                        edges.add(se, 
+                                                  ne)
+                                                      
+                                    if links.plusY[se]:
+                                        for ne2 in links.plusY[se]:
+                                            if ne2 != ne:
+                                                faces.add(se, ne2, ne)
+                                                edges.add(ne2, 
+                                                          ne)
+                                                
+                                else:
+                                    #Make Tri
+                                    faces.add(sw, nw, ne)
+                                    edges.add(sw,
+                                              ne)
+                        
+                        #Search North over ALL 
+                        elif links.plusX[sw]:
+                            for se in links.plusX[sw]:
+                                if links.plusY[se]:
+                                    for ne in links.plusY[se]:
+                                        faces.add(sw, nw, ne, se)
+                                        edges.add(ne,
+                                                  nw)
+                                                      
+                                    #Search South over ALL
+                                    if links.minusX[ne]:
+                                        for nw2 in links.minusX[ne]:
+                                            if nw2 != nw:
+                                                faces.add(ne, nw2, nw)
+                                                edges.add(nw2,
+                                                          nw)
+                                else:
+                                    #Make Tri
+                                    faces.add(sw, nw, se)
+                                    edges.add(nw,
+                                              se)
+                        
+                #Search East over ALL
+                elif links.plusX[sw]:
+                    for se in links.plusX[sw]:
+                        
+                        #Search North over ALL
+                        if links.plusY[se]:
+                            for ne in links.plusY[se]:
+                                
+                                if links.minusX[ne]:
+                                    for nw in links.minusX[ne]:
+                                        faces.add(sw, nw, ne, se)
+                                        edges.add(sw,
+                                                  nw)
+                                
+                                else:
+                                    #Make Tri
+                                    faces.add(sw, se, ne)
+                                    edges.add(sw,
+                                              ne)
+        
+        #Start at far corner                              
+        elif neProjection:
+            for ne in neProjection.indices():
+                
+                if links.minusY[ne]:
+                    for se in links.minusY[ne]:
+                        
+                        if links.minusX[ne]:
+                            for nw in links.minusX[ne]:
+                                
+                                if links.minusX[se]:
+                                    for sw in links.minusX[se]:
+                
+                                        faces.add(sw, nw, ne, se)
+                                        edges.add(sw,
+                                                  nw)
+                                        
+                                    if links.minusY[nw]:
+                                        for sw2 in links.minusY[nw]:
+                                            if sw2 != sw:
+                                                faces.add(sw, nw, sw2)
+                                                edges.add(sw,
+                                                          sw2)
+                                      
+                                elif links.minusY[nw]:
+                                    for sw in links.minusY[nw]:
+                                        
+                                        faces.add(sw, nw, ne, se)
+                                        edges.add(sw,
+                                                  se)
+                                                      
+                                else:
+                                    faces.add(se, ne, nw)
+                                    edges.add(se,
+                                              nw)
+
+                        elif links.minusX[se]:
+                            for sw in links.minusX[se]:
+                                faces.add(ne, sw, se)
+                                edges.add(sw,
+                                          ne)
+                
+                elif links.minusX[ne]:
+                        for nw in links.minusX[ne]:
+                            
+                            if links.minusY[nw]:
+                                for sw in links.minusY[nw]:
+                                    
+                                    faces.add(ne, nw, sw)
+                                    edges.add(ne,
+                                              sw)
+                                                
+        elif seProjection:
+            for se in seProjection.indices():
+                
+                 if links.minusX[se]:
+                    for sw in links.minusX[se]:
+                        
+                        if links.plusY[se]:
+                            for ne in links.plusY[se]:
+                                
+                                faces.add(se, ne, sw)
+                                edges.add(ne,
+                                          sw)
+                
+                
+        elif nwProjection:
+            for nw in nwProjection.indices():
+                
+                if links.minusY[nw]:
+                    for sw in links.minusY[nw]:
+                        
+                        if links.plusX[nw]:
+                            for ne in links.plusX[nw]:
+                                
+                                faces.add(ne, nw, sw)
+                                edges.add(ne,
+                                          sw)
+
+    def findInsideGrid(self, lines, vals):
+        "Classify the sorted vals against every line of scanlineHits"
+        return [self.findInsideList(line, vals) for line in lines]
+    
+    def findInsideList(self, line, vals):
+        "Return whether each of the sorted vals is inside along line"
+        hits = []
+        hits2 = set()
+        
+        for hit, onVert, vert, connected, isAcross in line:
+            if isAcross:
+                hits.append(hit)
+            else:
+                hits2.add(hit)
+        
+        hits.sort()
+        hMax = len(hits)
+        
+        #Walk vals and hits together, counting the hits below each val
+        inList = []
+        h = 0
+        for val in vals:
+            while h < hMax and hits[h] < val:
+                h += 1
+            
+            #Crossed an odd number of times, flipped by touching a tangent
+            inside = (h % 2 == 1) != (val in hits2)
+            
+            #Always inside when on the boundary
+            if h > 0 and abs(hits[h-1] - val) < ERROR_T:
+                inside = True
+            elif h < hMax and abs(hits[h] - val) < ERROR_T:
+                inside = True
+            
+            inList.append(inside)
+        
+        return inList
+    
+    def findXYGrid(self, coordsList):
+        "Snap the x and y of every vertex onto two lattices"
+        xs = []
+        ys = []
+        for coords in coordsList:
+            for x, y in coords:
+                xs.append(x)
+                ys.append(y)
+        
+        return Lattice(xs), Lattice(ys)
+
+def generateSurfaces(silX, silY, silZ=None, name="", workers=1, concurrent=False):
+    "buildSurfaces on Silhouettes, without Blender"
+    return GeometryBuilder().buildSurfaces(silX, silY, silZ, name, None,
+                                           workers, concurrent)
+
+
+# ---- Grid ----
+class IntersectStore:
+    "Struct of arrays holding every intersect of one surface, by id"
+    ON_V1 = 1
+    ON_V2 = 2
+    ON_BOTH = 3
+    INBETWEEN = 4
+    
+    def __init__(self):
+        self.hit = array('d')
+        self.x = array('d')
+        self.y = array('d')
+        self.i = array('i')
+        self.j = array('i')
+        
+        #Vertex index, only extra markings own one
+        self.index = array('i')
+        
+        #Silhouette vertex, -1 when the hit lies between two
+        self.vert = array('i')
+        self.onVert = array('b')
+        self.isAcross = array('b')
+        
+        #Connected silhouette vertices as compressed rows
+        self.connectedStart = array('i', [0])
+        self.connectedVerts = array('i')
+    
+    def __len__(self):
+        return len(self.hit)
+    
+    def __repr__(self):
+        ret = "<IntersectStore of " + str(len(self)) + ">\n"
+        for k in range(len(self)):
+            ret += "\t" + self.describe(k) + "\n"
+        return ret
+    
+    def describe(self, k):
+        ret = "<Intersect " + str(k) + " at ("+str(self.i[k])+","+str(self.j[k])+") ID:"+str(self.index[k])+"> "
+        ret += "\t vert #" + str(self.vert[k]) + \
+               " onVert:" + str(self.onVert[k]) + \
+               " connected=" + str(list(self.connected(k)))
+
+        ret += "\n\t hit=" +str(self.hit[k]) +  \
+               " x=" + str(self.x[k]) + \
+               " y=" + str(self.y[k]) + \
+               " isAcross=" + str(bool(self.isAcross[k]))
+        return ret
+    
+    def add(self, hit, onVert, vert, connected, isAcross, i, x):
+        "Append one row of scanlineHits, returning its id"
+        self.hit.append(hit)
+        self.x.append(x)
+        self.y.append(0.0)
+        self.i.append(-1 if i == None else i)
+        self.j.append(-1)
+        self.index.append(-1)
+        self.vert.append(-1 if vert == None else vert)
+        self.onVert.append(onVert)
+        self.isAcross.append(isAcross)
+        
+        self.connectedVerts.extend(connected)
+        self.connectedStart.append(len(self.connectedVerts))
+        
+        return len(self.hit) - 1
+    
+    def connected(self, k):
+        return self.connectedVerts[self.connectedStart[k]:self.connectedStart[k+1]]
+        
+    def isOnVert(self, k):
+        return (self.onVert[k] == self.ON_V1 or self.onVert[k] == self.ON_V2)
+    
+    def nbytes(self):
+        return arrayBytes(self.hit, self.x, self.y, self.i, self.j, self.index,
+                          self.vert, self.onVert, self.isAcross,
+                          self.connectedStart, self.connectedVerts)
+        
+
+class IntersectLine:
+    "A run of ids in an IntersectStore, all on the line at x"
+    def __init__(self, store, hits, i, x):
+        self.store = store
+        self.x = x
+        self.y = None
+        self.i = i
+        self.j = None
+        
+        start = len(store)
+        for hit, onVert, vert, connected, isAcross in hits:
+            store.add(hit, onVert, vert, connected, isAcross, i, x)
+        self.ids = range(start, len(store))
+        self.indexVerts()
+    
+    def __repr__(self):
+        ret = "<IntersectLine at (" + str(self.i) + "," + str(self.j)+")>\n"
+        for k in self.ids:
+            ret += "\t" + self.store.describe(k) + "\n"
+        return ret
+                                    
+    def indexVerts(self):
+        "Map vertex ids to the offsets of the intersects that touch them"
+        store = self.store
+        
+        #Offsets are kept in line order, repeated once per touch
+        self.onVerts = {}
+        self.touching = {}
+        for offset, k in enumerate(self.ids):
+            connected = store.connected(k)
+            if store.isOnVert(k):
+                self.onVerts.setdefault(store.vert[k], []).append(offset)
+            else:
+                for v in connected:
+                    self.onVerts.setdefault(v, []).append(offset)
+            
+            for v in connected:
+                self.touching.setdefault(v, []).append(offset)
+            if store.isOnVert(k):
+                self.touching.setdefault(store.vert[k], []).append(offset)
+    
+    def setY(self, j, y):
+        self.j = j
+        self.y = y
+         
+        for k in self.ids:
+            self.store.y[k] = y
+            self.store.j[k] = -1 if j == None else j
+    
+    def nbytes(self):
+        "Rough bytes of our intersects and vertex indices"
+        return self.store.nbytes() + objectBytes(self.onVerts) + objectBytes(self.touching)
+
+class GridCell:
+    "An inside grid cell, reading its intersects through its column's IntersectLine"
+    def __init__(self, line, y, base):
+        self.line = line
+        self.x = line.x
+        self.y = y
+        
+        #Vertex index of the first intersect
+        self.base = base
+    
+    def __repr__(self):
+        return "<GridCell at (" + str(self.x) + "," + str(self.y) + \
+               ") base:" + str(self.base) + ">\n" + str(self.line)
+    
+    def indices(self):
+        return range(self.base, self.base + len(self.line.ids))
+    
+    def nodes(self):
+        "Pairs of vertex index and intersect id"
+        return zip(self.indices(), self.line.ids)
+        
+    def findConnected(self, store, k, y):
+        "Return the indices of our intersects linked to intersect k of store, at height y"
+        #Should only have one match so always short circut
+        
+        #intersect is to our left or right
+        if abs(store.x[k] - self.x) < ERROR_T:
+            #Check for common vertex
+            if store.isOnVert(k):
+                return self.findVert(store.vert[k])
+            else:
+                for vert in store.connected(k):
+                    ret = self.findVert(vert)
+                    if ret:
+                        return ret
+        
+        #Intersct is abover or below us   
+        if abs(y - self.y) < ERROR_T:
+            #Check for connected vertex
+            
+            if store.isOnVert(k):
+                ret = self.findConnectedHelp(store.vert[k])
+            else:
+                for vert in store.connected(k):
+                    ret = []
+                    tmp = self.findConnectedHelp(vert)
+                    if tmp:
+                        ret += tmp
+                
+            if ret:
+                return ret
+        
+        #Intersect is on a diagonal with us 
+        else:
+            print("invalid intersect to compare")
+        
+        #No Matches
+        return []
+            
+    def findVert(self, vert):
+        "Indices of our intersects on vert, or crossing an edge of vert"
+        return [self.base + offset for offset in self.line.onVerts.get(vert, ())]
+
+    def findConnectedHelp(self, vert):
+        "Indices of our intersects on vert, or connected to it"
+        return [self.base + offset for offset in self.line.touching.get(vert, ())]
+
+class Adjacency:
+    "Links between vertex indices, grouped into a row per source once finished"
+    def __init__(self):
+        self.sources = array('i')
+        self.targets = array('i')
+        self.rows = None
+    
+    def link(self, source, target):
+        self.sources.append(source)
+        self.targets.append(target)
+    
+    def add(self, source, targets):
+        for target in targets:
+            self.link(source, target)
+    
+    def finish(self, size):
+        "Group the links by source, keeping the order they were added in"
+        #Not CSR: a slice per lookup made face detection 2.5 times slower.
+        #Rows only live while one gap is built, the largest of a 200-gon pair
+        #holding 0.5MB of them next to 32MB of kept grid state, and peak
+        #memory comes out at 70.6MB either way
+        rows = [[] for k in range(size)]
+        for source, target in zip(self.sources, self.targets):
+            rows[source].append(target)
+        
+        self.rows = rows
+        self.sources = None
+        self.targets = None
+    
+    def __getitem__(self, source):
+        return self.rows[source]
+
+class GridLinks:
+    "Directional links between intersects, by vertex index"
+    def __init__(self):
+        self.plusX = Adjacency()
+        self.plusY = Adjacency()
+        
+        self.minusX = Adjacency()
+        self.minusY = Adjacency()
+    
+    def finish(self, size):
+        for adjacency in (self.plusX, self.plusY, self.minusX, self.minusY):
+            adjacency.finish(size)
+    
+    def rows(self):
+        "LinkRows reading straight from our finished rows"
+        return LinkRows(self.plusX.rows, self.plusY.rows,
+                        self.minusX.rows, self.minusY.rows)
+
+class EdgeSet:
+    "Unique edges as packed (low, high) keys, flattened in the order first added"
+    def __init__(self):
+        self.keys = set()
+        self.flat = array('i')
+    
+    def __len__(self):
+        return len(self.flat) // 2
+    
+    def add(self, a, b):
+        if a > b:
+            a, b = b, a
+        key = (a << 32) | b
+        if not key in self.keys:
+            self.keys.add(key)
+            self.flat.append(a)
+            self.flat.append(b)
+    
+    def pairs(self):
+        return zip(self.flat[0::2], self.flat[1::2])
+    
+    def nbytes(self):
+        return arrayBytes(self.flat) + sys.getsizeof(self.keys)
+
+class NoEdges:
+    "Stands in for an EdgeSet when the edges aren't wanted, keeping nothing"
+    def __len__(self):
+        return 0
+    
+    def add(self, a, b):
+        pass
+    
+    def pairs(self):
+        return ()
+    
+    def nbytes(self):
+        return 0
+
+#Keeps nothing, so every unit can share it
+NO_EDGES = NoEdges()
+
+def edgeSink(withEdges):
+    "Where a unit collects its edges"
+    if withEdges:
+        return EdgeSet()
+    return NO_EDGES
+
+class FaceLoops:
+    "Faces as one flat array of loops and the size of each"
+    def __init__(self):
+        self.loops = array('i')
+        self.loopTotal = array('i')
+    
+    def __len__(self):
+        return len(self.loopTotal)
+    
+    def add(self, *face):
+        self.loops.extend(face)
+        self.loopTotal.append(len(face))
+
+class LinkRows:
+    "Directional links as plain lists of targets, indexed by vertex"
+    def __init__(self, plusX, plusY, minusX, minusY):
+        self.plusX = plusX
+        self.plusY = plusY
+        self.minusX = minusX
+        self.minusY = minusY
+
+class GridColumn:
+    "Cells, extra verts and vertical links of one band of a grid column, numbered from 0"
+    def __init__(self, key, edges):
+        self.key = key
+        self.size = 0
+        
+        #The column's intersects, shared with its other bands
+        self.line = None
+        
+        #Vertex index of the first intersect of each inside row, by y
+        self.cells = {}
+        
+        #Flat x, y, z of our verts
+        self.verts = array('d')
+        self.edges = edges
+        
+        #Flat (south, north) pairs in the order they were linked
+        self.links = array('i')
+    
+    def __repr__(self):
+        return "<GridColumn at " + str(self.key[0]) + " " + \
+               str(len(self.cells)) + " cells, " + str(self.size) + " verts>"
+    
+    def rowYs(self):
+        return [y for y, inside in self.key[2]]
+    
+    def shiftCells(self, offset):
+        "Our cells, renumbered to start at offset"
+        cells = {}
+        for y, base in self.cells.items():
+            cells[y] = GridCell(self.line, y, base + offset)
+        return cells
+    
+    def addLinks(self, links, offset):
+        for south, north in zip(self.links[0::2], self.links[1::2]):
+            links.plusY.link(south + offset, north + offset)
+            links.minusY.link(north + offset, south + offset)
+    
+    def nbytes(self):
+        return arrayBytes(self.verts, self.links) + objectBytes(self.cells) + \
+               self.edges.nbytes()
+
+class GridGap:
+    "Extra verts, horizontal links and faces of one band between two columns"
+    def __init__(self, key, westSize, eastSize, edges):
+        self.key = key
+        self.westSize = westSize
+        self.eastSize = eastSize
+        
+        self.verts = array('d')
+        self.edges = edges
+        self.faces = FaceLoops()
+    
+    def __repr__(self):
+        return "<GridGap " + str(len(self.verts) // 3) + " verts, " + \
+               str(len(self.faces)) + " faces>"
+    
+    def nbytes(self):
+        return arrayBytes(self.verts, self.faces.loops, self.faces.loopTotal) + \
+               self.edges.nbytes()
+
+class GridState:
+    """Column and gap bands of the last surface built, keyed by everything
+    they depend on, along with the lines of intersects the columns share"""
+    def __init__(self):
+        self.lines = {}
+        self.columns = {}
+        self.gaps = {}
+        
+        self.built = 0
+        self.reused = 0
+    
+    def __repr__(self):
+        return "<GridState " + str(len(self.columns)) + " columns, " + \
+               str(len(self.gaps)) + " gaps, last run built " + \
+               str(self.built) + " reused " + str(self.reused) + ">"
+    
+    def begin(self):
+        self.oldLines, self.lines = self.lines, {}
+        self.oldColumns, self.columns = self.columns, {}
+        self.oldGaps, self.gaps = self.gaps, {}
+        self.built = 0
+        self.reused = 0
+    
+    def end(self):
+        #Only keep what the latest surface used
+        self.oldLines = {}
+        self.oldColumns = {}
+        self.oldGaps = {}
+    
+    def line(self, key, build):
+        "The line of intersects for key, an (x, hits), which isn't counted as a unit"
+        if not key in self.lines:
+            self.lines[key] = self.oldLines.pop(key, None) or build(key)
+        return self.lines[key]
+    
+    def column(self, key, build, line):
+        return self.find(self.columns, self.oldColumns, key, build, line)
+    
+    def needsColumn(self, key):
+        return not (key in self.columns or key in self.oldColumns)
+    
+    def needsGap(self, key):
+        return not (key in self.gaps or key in self.oldGaps)
+    
+    def addColumn(self, key, column):
+        "Take a column built elsewhere, unless we already hold one for key"
+        if self.needsColumn(key):
+            #Each worker built its own copy of the line
+            column.line = self.line(key[:2], lambda lineKey: column.line)
+            self.columns[key] = column
+            self.built += 1
+    
+    def addGap(self, key, gap):
+        if self.needsGap(key):
+            self.gaps[key] = gap
+            self.built += 1
+    
+    def gap(self, key, build, west, east):
+        return self.find(self.gaps, self.oldGaps, key, build, west, east)
+    
+    def nbytes(self):
+        "Rough bytes held by our lines, columns and gaps"
+        return sum(line.nbytes() for line in self.lines.values()) + \
+               sum(column.nbytes() for column in self.columns.values()) + \
+               sum(gap.nbytes() for gap in self.gaps.values())
+    
+    def find(self, table, oldTable, key, build, *args):
+        if not key in table:
+            if key in oldTable:
+                table[key] = oldTable[key]
+                self.reused += 1
+            else:
+                table[key] = build(key, *args)
+                self.built += 1
+        return table[key]
+
+gridStates = {}
+
+def gridState(name):
+    "The grid state kept for the surface called name"
+    if not name in gridStates:
+        gridStates[name] = GridState()
+    return gridStates[name]
+
+def gridStateBytes(generator):
+    "Rough bytes of the grid states kept for the generator called generator"
+    return sum(gridStates[generator+suffix].nbytes() for suffix in PASS_SUFFIXES
+               if generator+suffix in gridStates)
+
+def dropGridStates(generator):
+    for suffix in PASS_SUFFIXES:
+        if generator+suffix in gridStates:
+            del gridStates[generator+suffix]
+
+def pruneGridStates(generators):
+    "Drop the grid states of every generator not named in generators"
+    keep = set(name+suffix for name in generators for suffix in PASS_SUFFIXES)
+    for name in list(gridStates):
+        if not name in keep:
+            del gridStates[name]
+
+
+# ---- Workers ----
+def buildPass(job):
+    "Run one surface pass on silhouette snapshots, inside a pool worker"
+    sx, sy, state = job
+    
+    #Pool workers cannot start pools of their own
+    mesh, edges = GeometryBuilder().getGeometry(sx, sy, state, None, 1, False)
+    return mesh, edges, state
+
+def buildStrip(strip):
+    "Build the columns and gaps of one strip, run inside a pool worker"
+    columnKeys, gapKeys = strip
+    builder = GeometryBuilder()
+    
+    columns = [builder.buildColumn(key) for key in columnKeys]
+    gaps = []
+    for i in range(len(gapKeys)):
+        east = None
+        if gapKeys[i][1] != None:
+            east = columns[i+1]
+        gaps.append(builder.buildGap(gapKeys[i], columns[i], east))
+    
+    #The last column only belongs to the strip east of us
+    return columns[:len(gapKeys)], gaps
+
+#One pool, kept while the worker count stays the same
+workerPools = {}
+
+def workerPool(workers):
+    "A pool of workers forked from us, or None where we can't fork"
+    if not workers in workerPools:
+        closeWorkerPools()
+        workerPools[workers] = forkPool(workers)
+    return workerPools[workers]
+
+def forkPool(workers):
+    #Spawned workers start sys.executable, which inside Blender is
+    #Blender itself, so only forking is safe
+    if hasattr(multiprocessing, "get_context"):
+        if not "fork" in multiprocessing.get_all_start_methods():
+            return None
+        return multiprocessing.get_context("fork").Pool(workers)
+    
+    #Older Pythons always fork, except on Windows
+    if sys.platform == "win32":
+        return None
+    return multiprocessing.Pool(workers)
+
+def closeWorkerPools():
+    for pool in workerPools.values():
+        if pool:
+            pool.terminate()
+    workerPools.clear()
+
+
+# ---- Scanlines ----
+class Lattice:
+    "Sorted values snapped together within ERROR_T, found through integer buckets"
+    def __init__(self, values=()):
+        #Buckets are ERROR_T wide, so each holds at most one value
+        self.buckets = {}
+        self.vals = []
+        self.positions = None
+        
+        for val in sorted(values):
+            self.snap(val)
+    
+    def __repr__(self):
+        return "<Lattice of " + str(len(self.vals)) + ">"
+    
+    def __len__(self):
+        return len(self.vals)
+    
+    def find(self, val):
+        "Return the value val snaps onto, or None"
+        bucket = int(floor(val / ERROR_T))
+        for b in (bucket, bucket-1, bucket+1):
+            if b in self.buckets and abs(self.buckets[b] - val) <= ERROR_T:
+                return self.buckets[b]
+        return None
+    
+    def snap(self, val):
+        "Return the value val snaps onto, adding val if there is none"
+        found = self.find(val)
+        if found != None:
+            return found
+        
+        self.buckets[int(floor(val / ERROR_T))] = val
+        if not self.vals or val > self.vals[-1]:
+            self.vals.append(val)
+        else:
+            insort(self.vals, val)
+        self.positions = None
+        return val
+    
+    def index(self, val):
+        "Position of the value val snaps onto, or None"
+        if self.positions == None:
+            self.positions = dict((v, i) for i, v in enumerate(self.vals))
+        found = self.find(val)
+        if found == None:
+            return None
+        return self.positions[found]
+    
+    def after(self, val):
+        "Position of the first value above val"
+        return bisect_right(self.vals, val)
+    
+    def strictlyBetween(self, low, high):
+        "The values more than ERROR_T inside low and high"
+        return self.vals[bisect_right(self.vals, low + ERROR_T):
+                         bisect_left(self.vals, high - ERROR_T)]
+
+class EdgeSweep:
+    "Active edge table over a silhouette, queried in increasing x"
+    def __init__(self, coords, edges):
+        #Edges sorted once by the low end of their extent
+        self.spans = []
+        for e in range(len(edges)):
+            a = coords[edges[e][0]][0]
+            b = coords[edges[e][1]][0]
+            self.spans.append((min(a, b), max(a, b), e))
+        self.spans.sort()
+        
+        self.reset()
+    
+    def __repr__(self):
+        return "<EdgeSweep at " + str(self.val) + " active=" + \
+               str([span[2] for span in self.active]) + ">"
+    
+    def reset(self):
+        self.val = None
+        self.next = 0
+        self.active = []
+    
+    def activeEdges(self, val):
+        "Return the ids of the edges whose extent covers val, in edge order"
+        #Going backwards means starting the sweep over
+        if self.val != None and val < self.val:
+            self.reset()
+        self.val = val
+        
+        spans = self.spans
+        while self.next < len(spans) and spans[self.next][0] - ERROR_T <= val:
+            self.active.append(spans[self.next])
+            self.next += 1
+        
+        #Everything still active covers val, so this costs O(hits)
+        self.active = [span for span in self.active if span[1] + ERROR_T >= val]
+        
+        return sorted([span[2] for span in self.active])
+
+class Silhouette:
+    "The name, (x, y) coords and edges of a silhouette mesh, without Blender"
+    def __init__(self, name, coords, edges):
+        self.name = name
+        self.coords = coords
+        self.edges = edges
+    
+    def __repr__(self):
+        return "<Silhouette " + self.name + " " + str(len(self.coords)) + \
+               " verts, " + str(len(self.edges)) + " edges>"
+
+class ScanlineMemo:
+    "Scanline hits of each silhouette, computed once per snapped x"
+    def __init__(self, reader=silhouetteArrays):
+        #id(silhouette) -> (silhouette, coords, edges, scanned Lattice, hits by x)
+        #Names can repeat, and holding the silhouette keeps its id from being reused
+        self.silhouettes = {}
+        
+        #Reads the (x, y) coords and edges of anything that isn't a Silhouette
+        self.reader = reader
+    
+    def entry(self, ob):
+        if id(ob) not in self.silhouettes:
+            if isinstance(ob, Silhouette):
+                coords, edges = ob.coords, ob.edges
+            else:
+                coords, edges = self.reader(ob)
+            self.silhouettes[id(ob)] = (ob, coords, edges, Lattice(), {})
+        return self.silhouettes[id(ob)]
+    
+    def snapshot(self, ob):
+        "A Silhouette of ob that can be sent to worker processes"
+        coords, edges = self.arrays(ob)
+        return Silhouette(ob.name, coords, edges)
+    
+    def arrays(self, ob):
+        "The coords and edges of ob, read once"
+        ob, coords, edges, scanned, lines = self.entry(ob)
+        return coords, edges
+    
+    def hits(self, ob, vals):
+        "scanlineHits of ob on vals, only scanning the x not seen before"
+        ob, coords, edges, scanned, lines = self.entry(ob)
+        
+        missing = []
+        for val in vals:
+            if scanned.find(val) == None:
+                missing.append(scanned.snap(val))
+        
+        if missing:
+            for x, hits in zip(missing, scanlineHits(coords, edges, missing)):
+                lines[x] = hits
+        
+        return [lines[scanned.find(val)] for val in vals]
+
+
+def scanlineHits(coords, edges, vals):
+    """Intersect a silhouette with every vertical line x = val in one pass
+    
+    Returns one tuple of hits per val, each hit being
+    (hit, onVert, vert, connected, isAcross) and merged on hit"""
+    ON_V1 = IntersectStore.ON_V1
+    ON_V2 = IntersectStore.ON_V2
+    INBETWEEN = IntersectStore.INBETWEEN
+    
+    lines = [None] * len(vals)
+    sweep = EdgeSweep(coords, edges)
+    
+    for k in sorted(range(len(vals)), key=vals.__getitem__):
+        x = vals[k]
+        line = {}
+        
+        #Hits within ERROR_T of each other are the same intersect
+        hitGrid = Lattice()
+        
+        for e in sweep.activeEdges(x):
+            vert1, vert2 = edges[e]
+            x1, y1 = coords[vert1]
+            x2, y2 = coords[vert2]
+            
+            if abs(x1 - x) < ERROR_T:
+                if abs(x2 - x) < ERROR_T:
+                    #Don't connect vertically
+                    hit, onVert, vert, connected = y1, ON_V1, vert1, []
+                else:
+                    hit, onVert, vert, connected = y1, ON_V1, vert1, [vert2]
+            elif abs(x2 - x) < ERROR_T:
+                hit, onVert, vert, connected = y2, ON_V2, vert2, [vert1]
+            elif x1 < x < x2 or x2 < x < x1:
+                hit = (y2-y1)*(x- x1)/(x2-x1) + y1
+                onVert, vert, connected = INBETWEEN, None, [vert1, vert2]
+            else:
+                continue
+            
+            hit = hitGrid.snap(hit)
+            if hit in line:
+                intersect = line[hit]
+                for v in connected:
+                    if not v in intersect[3]:
+                        intersect[3].append(v)
+            else:
+                intersect = [hit, onVert, vert, connected, True]
+                line[hit] = intersect
+            
+            # Correctly set isAcross so we can to point in polygon correctly
+            # A vertex is settled as soon as both of its neighbours are known
+            if intersect[1] != INBETWEEN and len(intersect[3]) == 2:
+                c1 = coords[intersect[3][0]][0]
+                c2 = coords[intersect[3][1]][0]
+                if c1 < x and c2 < x:
+                    intersect[4] = False
+                elif c1 > x and c2 > x:
+                    intersect[4] = False
+        
+        lines[k] = tuple([(hit, onVert, vert, tuple(connected), isAcross)
+                          for hit, onVert, vert, connected, isAcross in line.values()])
+    
+    return lines
@@ -0,0 +1,814 @@
+    # ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import bpy
+from mathutils import Vector
+from array import array
+from collections import OrderedDict
+from hashlib import sha1
+import re
+try:
+    import bmesh
+except ImportError:
+    bmesh = None
+try:
+    from bpy.app.handlers import persistent
+    handlers = bpy.app.handlers
+except ImportError:
+    #No app handlers before Blender 2.6, so nothing resets on file load
+    handlers = None
+    persistent = lambda handler: handler
+from .Kernel import ERROR_T, MERGE_T, MeshBuffers, GeometryBuilder, Silhouette, \
+                    ScanlineMemo, gridStates, gridStateBytes, dropGridStates, \
+                    pruneGridStates, closeWorkerPools
+#from math import abs
+
+#Debug Line
+from time import ctime
+print("-------------------",ctime(),"-------------------")
+
+# ---- Properties ----
+def setProp(propName, data, object=None):
+    "Changes or Adds Property with data"
+    if not object:
+        object = bpy.context.object
+    object[propName] = data
+
+
+def hasProp(propName, object=None):
+    "Return True iff object has property"
+    if not object:
+        object = bpy.context.object
+    try:
+        object[propName]
+        return True
+    except:
+        return False
+
+
+def getProp(propName, object=None):
+    "Returns property if it exists"
+    if not object:
+        object = bpy.context.object
+    try:
+        return object[propName]
+    except:
+        #print("Error: Cannot Return Property Value")
+        #print("Requested Property (" + propName + " does not exist")
+        return False
+
+def sortProp(propName,keyFunc):
+    "Sort property using the given key"
+    list = eval(getProp(propName))
+    list.sort(key=keyFunc)
+    setProp(propName,str(list))
+
+
+def addEnum(propName,enum,label):
+    "Work around for declaring enumerations"
+    exec("bpy.types.Object." + \
+         propName + " = bpy.props.EnumProperty(items=enum,name = label)")
+
+
+# ---- Objects ----
+def hasObject(objectName):
+    try:
+        bpy.data.objects[objectName]
+        return True
+    except:
+        return False
+
+
+def getObject(objectName):
+    try:
+        return bpy.data.objects[objectName]
+    except:
+        return False
+
+def remProp(propName, object=None):
+    "If property exists, removes property and returns True"
+    if not object:
+        object = bpy.context.object
+    try:
+        del(object[propName])
+        return True
+    except:
+        print('Error: Cannot Delete')
+        print("Requested Property ( " + propName + " ) does not exist")
+        return False
+
+def selectObjectName(objectName):
+    for ob in bpy.data.objects:
+        if ob.name == objectName:
+            ob.select = True
+        else:
+            ob.select = False
+
+def getSelectedObjects():
+    return [ob for ob in bpy.data.objects if ob.select]
+
+def addMesh(name, buffers):
+        if name:
+            me = bpy.data.meshes.new(name+'Mesh')
+            ob = bpy.data.objects.new(name, me)
+            ob.location = Vector()
+            me["silhouetteGenerated"] = True
+            ob["silhouetteGenerated"] = True
+            
+            scn = bpy.context.scene
+            scn.objects.link(ob)
+            scn.objects.active = ob
+            ob.select = True
+         
+            fillMesh(me, buffers)
+            
+            return ob
+        return False
+
+def fillMesh(me, buffers):
+    "Fill an empty mesh from MeshBuffers, in bulk where the mesh has polygons"
+    if hasattr(me, "polygons"):
+        me.vertices.add(buffers.vertCount())
+        me.vertices.foreach_set("co", buffers.coords)
+        me.loops.add(len(buffers.loops))
+        me.loops.foreach_set("vertex_index", buffers.loops)
+        me.polygons.add(buffers.faceCount())
+        me.polygons.foreach_set("loop_start", buffers.loopStart)
+        me.polygons.foreach_set("loop_total", buffers.loopTotal)
+        me.update(calc_edges=True)
+    else:
+        #Tessellated faces can't take mixed tris and quads in bulk
+        me.from_pydata(buffers.verts(), [], buffers.faces())
+        me.update()
+
+#RNA attributes are slow to read one at a time, so meshes are read
+#a whole attribute at once with foreach_get
+def meshCoords(me):
+    "Every vertex coordinate of mesh me, flat as x, y, z"
+    coords = array('f', [0.0]) * (3*len(me.vertices))
+    me.vertices.foreach_get("co", coords)
+    return coords
+
+def meshEdges(me):
+    "The vertex pair of every edge of mesh me, flat"
+    edges = array('i', [0]) * (2*len(me.edges))
+    me.edges.foreach_get("vertices", edges)
+    return edges
+
+def meshLoops(me):
+    "The loops, loop starts and loop totals of a mesh with polygons"
+    loops = array('i', [0]) * len(me.loops)
+    me.loops.foreach_get("vertex_index", loops)
+    loopStart = array('i', [0]) * len(me.polygons)
+    me.polygons.foreach_get("loop_start", loopStart)
+    loopTotal = array('i', [0]) * len(me.polygons)
+    me.polygons.foreach_get("loop_total", loopTotal)
+    return loops, loopStart, loopTotal
+
+def meshArrays(me):
+    "Return the (x, y) of every vertex and the vertex pair of every edge of mesh me"
+    coords = meshCoords(me)
+    edges = meshEdges(me)
+    return list(zip(coords[0::3], coords[1::3])), list(zip(edges[0::2], edges[1::2]))
+
+def objectArrays(ob):
+    "The Kernel's reader for mesh objects, giving their (x, y) coords and edges"
+    return meshArrays(ob.data)
+
+def readMesh(me):
+    "MeshBuffers holding the vertices and faces of mesh me"
+    buffers = MeshBuffers()
+    buffers.coords = meshCoords(me)
+    if hasattr(me, "polygons"):
+        buffers.loops, buffers.loopStart, buffers.loopTotal = meshLoops(me)
+    else:
+        for face in me.faces:
+            buffers.addFace(face.vertices)
+    return buffers
+
+def sameTopology(me, buffers):
+    "True if me already has the vertices and faces of buffers, in order"
+    if len(me.vertices) != buffers.vertCount() or \
+       len(meshFaces(me)) != buffers.faceCount():
+        return False
+    
+    if hasattr(me, "polygons"):
+        return len(me.loops) == len(buffers.loops) and \
+               meshLoops(me) == (buffers.loops, buffers.loopStart, buffers.loopTotal)
+    
+    return [list(face.vertices) for face in me.faces] == buffers.faces()
+
+def refillMesh(ob, buffers):
+    "Write buffers into the mesh of ob, keeping the datablock where Blender can"
+    me = ob.data
+    if sameTopology(me, buffers):
+        #Only the shape changed
+        me.vertices.foreach_set("co", buffers.coords)
+        me.update()
+    elif bmesh:
+        #Writing an empty bmesh clears the mesh without replacing it
+        empty = bmesh.new()
+        empty.to_mesh(me)
+        empty.free()
+        fillMesh(me, buffers)
+    else:
+        #Meshes can't be emptied before bmesh, so swap in a new one
+        #and free the old one
+        old = me
+        me = bpy.data.meshes.new(old.name)
+        me["silhouetteGenerated"] = True
+        for material in old.materials:
+            me.materials.append(material)
+        fillMesh(me, buffers)
+        ob.data = me
+        if not old.users:
+            bpy.data.meshes.remove(old)
+
+def meshFaces(me):
+    "Faces of a mesh, whichever name this Blender gives them"
+    if hasattr(me, "polygons"):
+        return me.polygons
+    return me.faces
+
+#=== Surface Cache ===
+class SurfaceCache:
+    "Least recently used store of finished surfaces, keyed by their inputs"
+    def __init__(self, maxEntries=16, maxBytes=256*1024*1024):
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.bytes = 0
+    
+    def __repr__(self):
+        return "<SurfaceCache " + str(len(self.entries)) + " entries, " + \
+               str(self.bytes) + " bytes>"
+    
+    def key(self, silhouettes):
+        "Hash the silhouettes' geometry, by axis, along with the tolerances"
+        h = sha1(repr((ERROR_T, MERGE_T)).encode())
+        for silhouette in silhouettes:
+            if silhouette:
+                coords, edges = silhouette.coords, silhouette.edges
+                h.update(b"S" + str((len(coords), len(edges))).encode())
+                h.update(array('d', [c for co in coords for c in co]).tobytes())
+                h.update(array('i', [v for edge in edges for v in edge]).tobytes())
+            else:
+                h.update(b"-")
+        return h.hexdigest()
+    
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        return None
+    
+    def put(self, key, surfaces):
+        "Store a list of (suffix, MeshBuffers)"
+        if key in self.entries:
+            self.remove(key)
+        
+        size = 0
+        for suffix, buffers in surfaces:
+            size += buffers.nbytes()
+        
+        self.entries[key] = surfaces
+        self.sizes[key] = size
+        self.bytes += size
+        self.evict()
+    
+    def remove(self, key):
+        del self.entries[key]
+        self.bytes -= self.sizes.pop(key)
+    
+    def resize(self, maxEntries, maxBytes):
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.evict()
+    
+    def evict(self):
+        while self.entries and (len(self.entries) > self.maxEntries or \
+                                self.bytes > self.maxBytes):
+            self.remove(next(iter(self.entries)))
+    
+    def clear(self):
+        self.entries.clear()
+        self.sizes.clear()
+        self.bytes = 0
+
+surfaceCache = SurfaceCache()
+
+#=== Generator Registry ===
+SILHOUETTE_ROLES = ("silhouetteX", "silhouetteY", "silhouetteZ")
+SURFACE_ROLES = ("Surface", "Surface2", "Surface3")
+
+def removeObject(ob):
+    "Delete ob without going through the selection"
+    for scn in ob.users_scene:
+        scn.objects.unlink(ob)
+    bpy.data.objects.remove(ob)
+
+class GeneratorRegistry:
+    """The silhouette inputs and surfaces of every generator, by name
+    
+    Every object it tracks carries a silhouetteId property, so a name can be
+    checked with one lookup. The objects are only scanned, once, after a
+    name goes stale through a rename, delete, duplicate or reload"""
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        "Forget every generator, as when another file is loaded"
+        #Generator id -> {role: (object id, object name)}
+        self.entries = {}
+        self.lastId = 0
+        self.scans = 0
+    
+    def __repr__(self):
+        return "<GeneratorRegistry " + str(len(self.entries)) + " generators, " + \
+               str(self.scans) + " scans>"
+    
+    def tag(self, ob):
+        "The id of ob, giving it a new one if it has none"
+        if not hasProp("silhouetteId", ob) and not self.scans:
+            #Ids saved with the file must not be handed out again
+            self.resync()
+        if not hasProp("silhouetteId", ob):
+            self.lastId += 1
+            ob["silhouetteId"] = self.lastId
+        return ob["silhouetteId"]
+    
+    def find(self, objectId, name):
+        "The object called name, as long as it is still the one tagged objectId"
+        ob = bpy.data.objects.get(name)
+        if ob and ob.users and ob.get("silhouetteId") == objectId:
+            return ob
+        return None
+    
+    def entry(self, generator):
+        "The roles of generator, rescanning first if they have gone stale"
+        entry = self.entries.get(generator.get("silhouetteId"))
+        if entry == None or entry["generator"][1] != generator.name:
+            self.resync()
+            objectId = self.tag(generator)
+            entry = self.entries.setdefault(objectId, {"generator": (objectId, generator.name)})
+        return entry
+    
+    def silhouette(self, generator, role):
+        "The object generator reads in role, following it through renames"
+        entry = self.entry(generator)
+        name = getattr(generator, role)
+        if name and role in entry and entry[role][1] == name and \
+           self.find(*entry[role]) == None:
+            self.resync()
+            entry = self.entry(generator)
+            name = getattr(generator, role)
+        
+        ob = name and bpy.data.objects.get(name)
+        if ob and ob.users:
+            entry[role] = (self.tag(ob), ob.name)
+            return ob
+        
+        if role in entry:
+            del entry[role]
+        return None
+    
+    def surfaces(self, generator):
+        "The surfaces of generator, by role"
+        entry = self.entry(generator)
+        for role in SURFACE_ROLES:
+            if role in entry and self.find(*entry[role]) == None:
+                self.resync()
+                entry = self.entry(generator)
+                break
+        
+        return dict((role, self.find(*entry[role]))
+                    for role in SURFACE_ROLES if role in entry)
+    
+    def peekSurfaces(self, generator):
+        """The surfaces of generator, by role, without rescanning or tagging
+        anything. Blender refuses ID writes while drawing, so draw uses this,
+        and gets nothing back until an operator has brought the entry up to date"""
+        entry = self.entries.get(generator.get("silhouetteId"))
+        if entry == None or entry["generator"][1] != generator.name:
+            return {}
+        
+        surfaces = {}
+        for role in SURFACE_ROLES:
+            if role in entry:
+                surfaces[role] = self.find(*entry[role])
+                if surfaces[role] == None:
+                    return {}
+        return surfaces
+    
+    def addSurface(self, generator, role, surface):
+        entry = self.entry(generator)
+        surface["silhouetteOwner"] = generator["silhouetteId"]
+        surface["silhouetteRole"] = role
+        surface.data["silhouetteOwner"] = generator["silhouetteId"]
+        entry[role] = (self.tag(surface), surface.name)
+    
+    def removeSurfaces(self, generator, keep=()):
+        "Delete the surfaces of generator, except the roles in keep"
+        for role, surface in self.surfaces(generator).items():
+            if not role in keep:
+                removeObject(surface)
+                del self.entries[generator["silhouetteId"]][role]
+    
+    def resync(self):
+        "Rebuild every entry from the tags, in one pass over the objects"
+        self.scans += 1
+        old = self.entries
+        self.entries = {}
+        
+        #Who had each id when we last looked
+        known = {}
+        for entry in old.values():
+            for objectId, name in entry.values():
+                known[objectId] = name
+        
+        tagged = {}
+        generators = []
+        for ob in bpy.data.objects:
+            if not ob.users:
+                continue
+            if hasProp("Silhouette", ob):
+                generators.append(ob)
+            
+            objectId = ob.get("silhouetteId")
+            if objectId == None:
+                continue
+            self.lastId = max(self.lastId, objectId)
+            
+            if objectId in tagged:
+                #Duplicates carry their original's tags, so the copy loses them
+                copy = ob
+                if ob.name == known.get(objectId):
+                    copy, tagged[objectId] = tagged[objectId], ob
+                for prop in ("silhouetteId", "silhouetteOwner", "silhouetteRole"):
+                    if hasProp(prop, copy):
+                        del copy[prop]
+            else:
+                tagged[objectId] = ob
+        
+        for generator in generators:
+            objectId = self.tag(generator)
+            entry = self.entries[objectId] = {"generator": (objectId, generator.name)}
+            
+            #Inputs renamed since they were read get their new names written back
+            for role in SILHOUETTE_ROLES:
+                if role in old.get(objectId, {}):
+                    inputId, name = old[objectId][role]
+                    ob = tagged.get(inputId)
+                    if ob and getattr(generator, role) == name:
+                        setattr(generator, role, ob.name)
+                        entry[role] = (inputId, ob.name)
+        
+        for ob in tagged.values():
+            owner = ob.get("silhouetteOwner")
+            if owner in self.entries:
+                self.entries[owner][ob["silhouetteRole"]] = (ob["silhouetteId"], ob.name)
+        
+        #Surfaces made before there was a registry are still found by name
+        for generator in generators:
+            entry = self.entries[generator["silhouetteId"]]
+            for role in SURFACE_ROLES:
+                ob = getObject(generator.name+role)
+                if not role in entry and ob and ob.users and \
+                   not hasProp("silhouetteOwner", ob):
+                    self.addSurface(generator, role, ob)
+
+generators = GeneratorRegistry()
+
+#=== Memory Accounting ===
+#Rough bytes Blender keeps for each vertex, edge, face corner and face
+VERT_BYTES = 20
+EDGE_BYTES = 12
+LOOP_BYTES = 8
+FACE_BYTES = 12
+
+#Surface meshes made before they were tagged
+LEGACY_MESH_NAME = re.compile(r"Surface[23]?Mesh(\.\d+)?$")
+
+def meshStats(me):
+    "The vertex count, face count and estimated bytes of mesh me"
+    verts = len(me.vertices)
+    faces = len(meshFaces(me))
+    loops = 0
+    if hasattr(me, "polygons"):
+        loops = len(me.loops)
+    return verts, faces, verts*VERT_BYTES + len(me.edges)*EDGE_BYTES + \
+                         loops*LOOP_BYTES + faces*FACE_BYTES
+
+def isGenerated(data):
+    "True if the addon made datablock data"
+    return hasProp("silhouetteGenerated", data) or \
+           (isinstance(data, bpy.types.Mesh) and LEGACY_MESH_NAME.search(data.name) != None)
+
+def orphanMeshes():
+    "Meshes the addon made that nothing uses any more"
+    return [me for me in bpy.data.meshes if not me.users and isGenerated(me)]
+
+def liveGenerators():
+    "Names of the generators the registry knows that still exist"
+    return [entry["generator"][1] for entry in generators.entries.values()
+            if generators.find(*entry["generator"])]
+
+def memoryReport():
+    """Surface and orphan usage of every generator, as rows of
+    (generator name, verts, faces, bytes, grid state bytes, orphans, orphan bytes)"""
+    generators.resync()
+    pruneGridStates(liveGenerators())
+    rows = {}
+    for objectId, entry in generators.entries.items():
+        verts = faces = size = 0
+        for role in SURFACE_ROLES:
+            surface = role in entry and generators.find(*entry[role])
+            if surface:
+                stats = meshStats(surface.data)
+                verts += stats[0]
+                faces += stats[1]
+                size += stats[2]
+        name = entry["generator"][1]
+        rows[objectId] = [name, verts, faces, size, gridStateBytes(name), 0, 0]
+    
+    #Orphans whose generator is gone are reported together
+    rows[None] = ["(no generator)", 0, 0, 0, 0, 0, 0]
+    for me in orphanMeshes():
+        owner = me.get("silhouetteOwner")
+        if not owner in rows:
+            owner = None
+        rows[owner][5] += 1
+        rows[owner][6] += meshStats(me)[2]
+    
+    if not rows[None][5]:
+        del rows[None]
+    return sorted(tuple(row) for row in rows.values())
+
+def reclaimOrphans():
+    "Free every datablock the addon made that nothing uses. Returns (objects, meshes, bytes)"
+    objects = [ob for ob in bpy.data.objects if not ob.users and isGenerated(ob)]
+    for ob in objects:
+        bpy.data.objects.remove(ob)
+    
+    #Freeing the objects can leave their meshes unused too
+    meshes = orphanMeshes()
+    size = sum(meshStats(me)[2] for me in meshes)
+    for me in meshes:
+        bpy.data.meshes.remove(me)
+    return len(objects), len(meshes), size
+
+#=== The User Interface ===
+class Panel(bpy.types.Panel):
+    bl_label = "Silhouette"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "TOOLS"
+
+    @classmethod
+    def poll(self, context):
+        try:
+            if bpy.context.object == None:
+                return true
+            return bpy.context.object.mode == "OBJECT"
+        except:
+            return False
+        
+    def draw(self,context):
+        layout = self.layout
+        
+        row1 = layout.row()
+        row1.operator("add.obj", text="Add Silhouette Object")
+        
+        if hasProp("Silhouette"):
+            box = layout.box()
+            box.label("Active Object Silhouette Properties")
+            box.prop(context.object, "silhouetteX", text="X Axis (Front)")
+            box.prop(context.object, "silhouetteY", text="Y Axis (Side)")
+            box.prop(context.object, "silhouetteZ", text="Z Axis (Top)")
+            box.operator("generate.obj", text="Generate")
+            box.operator("cleanup.obj", text="Remove Mesh")
+            
+            box = layout.box()
+            box.label("Surface Cache")
+            box.prop(context.scene, "silhouetteCacheSize", text="Entries")
+            box.prop(context.scene, "silhouetteCacheMegabytes", text="Megabytes")
+            
+            box = layout.box()
+            box.label("Memory")
+            surfaces = generators.peekSurfaces(context.object)
+            if surfaces:
+                verts = faces = size = 0
+                for surface in surfaces.values():
+                    stats = meshStats(surface.data)
+                    verts += stats[0]
+                    faces += stats[1]
+                    size += stats[2]
+                box.label(str(verts) + " verts, " + str(faces) + " faces, " + \
+                          str(size // 1024) + " KB")
+            box.operator("report.obj", text="Memory Report")
+            box.operator("reclaim.obj", text="Reclaim Orphans")
+            
+            box = layout.box()
+            box.label("Parallel Generation")
+            box.prop(context.scene, "silhouetteWorkers", text="Worker Processes")
+            box.prop(context.scene, "silhouetteConcurrentPasses", text="Concurrent Passes")
+
+
+
+#=== Operators ===
+class MESH_OT_AddSilhouetteObject(bpy.types.Operator):
+    bl_idname = "add.obj"
+    bl_label = "Add Silhouette Object"
+
+    def execute(self, context):
+        bpy.ops.object.add(type = 'EMPTY')
+        setProp("Silhouette", True)
+        generators.tag(context.object)
+        return{'FINISHED'}
+    
+class MESH_OT_Remove(bpy.types.Operator):
+    bl_idname = "cleanup.obj"
+    bl_label = "Remove Mesh"
+    
+    def execute(self, context):
+        ob = context.object
+        generators.removeSurfaces(ob)
+        
+        #Nothing left to regenerate incrementally
+        dropGridStates(ob.name)
+        return{'FINISHED'}
+
+class MESH_OT_MemoryReport(bpy.types.Operator):
+    bl_idname = "report.obj"
+    bl_label = "Memory Report"
+    
+    def execute(self, context):
+        total = 0
+        for name, verts, faces, size, stateSize, orphans, orphanSize in memoryReport():
+            print(name + ": " + str(verts) + " verts, " + str(faces) + " faces, " + \
+                  str(size) + " bytes, grid state " + str(stateSize) + " bytes, " + \
+                  str(orphans) + " orphans of " + str(orphanSize) + " bytes")
+            total += size + stateSize + orphanSize
+        print("Surface cache: " + str(surfaceCache.bytes) + " bytes")
+        
+        self.report({'INFO'}, "Silhouette meshes use about " + str(total // 1024) + \
+                    " KB, cache " + str(surfaceCache.bytes // 1024) + " KB")
+        return{'FINISHED'}
+
+class MESH_OT_Reclaim(bpy.types.Operator):
+    bl_idname = "reclaim.obj"
+    bl_label = "Reclaim Orphans"
+    
+    def execute(self, context):
+        objects, meshes, size = reclaimOrphans()
+        self.report({'INFO'}, "Freed " + str(objects) + " objects and " + str(meshes) + \
+                    " meshes, about " + str(size // 1024) + " KB")
+        return{'FINISHED'}
+
+class MESH_OT_GenerateMesh(bpy.types.Operator, GeometryBuilder):
+    bl_idname = "generate.obj"
+    bl_label = "Generate Mesh"
+    reader = staticmethod(objectArrays)
+
+    def execute(self, context):
+        #print("\n+++++++++++++++++",ctime(),"+++++++++++++++++")
+        
+        #Get Generator Object
+        ob = context.object
+        name = ob.name
+        loc = ob.location
+        
+        #Input geometry, read without adding objects to the scene
+        #Silhouettes are false if prop doesn't exist
+        silX = self.readSilhouette(generators.silhouette(ob, "silhouetteX"), context)
+        silY = self.readSilhouette(generators.silhouette(ob, "silhouetteY"), context)
+        silZ = self.readSilhouette(generators.silhouette(ob, "silhouetteZ"), context)
+        
+        #Unchanged inputs give back the surfaces made last time
+        surfaceCache.resize(context.scene.silhouetteCacheSize,
+                            context.scene.silhouetteCacheMegabytes*1024*1024)
+        key = None
+        if silX and silY:
+            key = surfaceCache.key([silX, silY, silZ])
+        cached = key and surfaceCache.get(key)
+        
+        #Renamed and deleted generators can't be regenerated incrementally
+        pruneGridStates(liveGenerators())
+        
+        #Scanlines shared between the passes of this Generate
+        memo = ScanlineMemo(self.reader)
+        workers = context.scene.silhouetteWorkers
+        
+        #Surfaces made this time, the rest are left over from before
+        written = []
+        
+        if cached:
+            written = self.restoreSurfaces(ob, cached, loc)
+        
+        elif silX and silY:
+            surfaces = self.buildSurfaces(silX, silY, silZ, name, memo, workers,
+                                          context.scene.silhouetteConcurrentPasses)
+            
+            #Actually generate the meshes, into the old ones if there are any
+            for suffix, mesh in surfaces:
+                written.append(self.writeSurface(ob, suffix, mesh, loc))
+            
+            #Kept as built, Blender has nothing to add to them
+            surfaceCache.put(key, surfaces)
+        
+        #Deleate Old Surfaces that weren't made again
+        generators.removeSurfaces(ob, written)
+        
+        #Leave the generator selected and active, as it was
+        for surface in generators.surfaces(ob).values():
+            surface.select = False
+        context.scene.objects.active = ob
+        ob.select = True
+        
+        return{'FINISHED'}
+    
+    def restoreSurfaces(self, generator, surfaces, loc):
+        """Rewrite cached surfaces, returning their suffixes. Transforms the
+        user has given the surfaces are left alone"""
+        return [self.writeSurface(generator, suffix, buffers, loc)
+                for suffix, buffers in surfaces]
+    
+    def writeSurface(self, generator, suffix, buffers, loc):
+        """Put buffers into the surface of generator called suffix, updating
+        its mesh in place if it already has one. Returns suffix"""
+        surface = generators.surfaces(generator).get(suffix)
+        if surface:
+            refillMesh(surface, buffers)
+        else:
+            surface = addMesh(generator.name+suffix, buffers)
+        generators.addSurface(generator, suffix, surface)
+        surface.location = loc
+        return suffix
+    
+    def readSilhouette(self, ob, context):
+        "Snapshot the evaluated geometry of ob, curves included"
+        if ob:
+            #A temporary mesh that is never linked, freed as soon as it is read
+            me = ob.to_mesh(context.scene, True, 'PREVIEW')
+            me["silhouetteGenerated"] = True
+            coords, edges = meshArrays(me)
+            bpy.data.meshes.remove(me)
+            
+            return Silhouette(ob.name, coords, edges)
+        return False
+
+@persistent
+def resetSession(dummy):
+    "Forget the last file's generators and everything kept for them"
+    #Ids are only unique within a file, so tag rescans the new one first
+    generators.reset()
+    gridStates.clear()
+    surfaceCache.clear()
+
+def register():
+    bpy.types.Object.silhouetteX = bpy.props.StringProperty(default = "")
+    bpy.types.Object.silhouetteY = bpy.props.StringProperty(default = "")
+    bpy.types.Object.silhouetteZ = bpy.props.StringProperty(default = "")
+    
+    bpy.types.Scene.silhouetteCacheSize = bpy.props.IntProperty(default = 16, min = 0)
+    bpy.types.Scene.silhouetteCacheMegabytes = bpy.props.IntProperty(default = 256, min = 0)
+    bpy.types.Scene.silhouetteWorkers = bpy.props.IntProperty(default = 1, min = 1, max = 64)
+    bpy.types.Scene.silhouetteConcurrentPasses = bpy.props.BoolProperty(default = False)
+    
+    bpy.utils.register_class(Panel)
+    bpy.utils.register_class(MESH_OT_AddSilhouetteObject)
+    bpy.utils.register_class(MESH_OT_GenerateMesh)
+    bpy.utils.register_class(MESH_OT_Remove)
+    bpy.utils.register_class(MESH_OT_MemoryReport)
+    bpy.utils.register_class(MESH_OT_Reclaim)
+    
+    if handlers:
+        handlers.load_post.append(resetSession)
+    
+def unregister():
+    if handlers and resetSession in handlers.load_post:
+        handlers.load_post.remove(resetSession)
+    closeWorkerPools()
+    bpy.utils.unregister_class(Panel)
+    bpy.utils.unregister_class(MESH_OT_AddSilhouetteObject)
+    bpy.utils.unregister_class(MESH_OT_GenerateMesh)
+    bpy.utils.unregister_class(MESH_OT_Remove)
+    bpy.utils.unregister_class(MESH_OT_MemoryReport)
+    bpy.utils.unregister_class(MESH_OT_Reclaim)
+
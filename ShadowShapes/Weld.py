@@ -0,0 +1,190 @@
+#=== Vertex Welding ===
+#Merges vertices closer than a threshold, the way remove_doubles does,
+#without needing Blender. Vertices are bucketed in a uniform spatial hash
+#of threshold sized cells, so each one is only compared against the few
+#vertices in the 27 cells around it, and merged through union-find.
+#Expected time is O(n) for n vertices. Only vertices that weldCandidates
+#picks out can have a near double, so the rest can skip the hash entirely.
+
+from array import array
+from math import floor
+from time import time
+
+# ---- Union-Find ----
+def findRoot(parent, v):
+    "Root of v's set, halving the path on the way"
+    while parent[v] != v:
+        parent[v] = parent[parent[v]]
+        v = parent[v]
+    return v
+
+
+def union(parent, a, b):
+    "Merge the sets of a and b, the lower index staying the root"
+    a = findRoot(parent, a)
+    b = findRoot(parent, b)
+    if a < b:
+        parent[b] = a
+    elif b < a:
+        parent[a] = b
+
+
+# ---- Welding ----
+def weldCandidates(coords, threshold):
+    """Vertices with a coordinate within threshold of a different value on
+    the same axis
+
+    Two distinct vertices within threshold must differ by at most threshold
+    on some axis, so every near double is in this list"""
+    count = len(coords) // 3
+    flagged = array('b', [0]) * count
+    for axis in range(3):
+        values = coords[axis::3]
+        ordered = sorted(set(values))
+        near = set()
+        for low, high in zip(ordered, ordered[1:]):
+            if high - low <= threshold:
+                near.add(low)
+                near.add(high)
+
+        if near:
+            for v, c in enumerate(values):
+                if c in near:
+                    flagged[v] = 1
+
+    return [v for v in range(count) if flagged[v]]
+
+
+def weldMap(coords, threshold, candidates=None):
+    """Map every vertex of the flat xyz coords onto its welded index
+
+    Each merged group keeps its lowest vertex, and groups are numbered in
+    the order of those vertices. If candidates is given, only those vertices
+    are compared. Returns the map and the number of groups"""
+    count = len(coords) // 3
+    parent = list(range(count))
+    limit = threshold * threshold
+    if candidates is None:
+        candidates = range(count)
+
+    cells = {}
+    for v in candidates:
+        x = coords[3*v]
+        y = coords[3*v+1]
+        z = coords[3*v+2]
+        i = int(floor(x / threshold))
+        j = int(floor(y / threshold))
+        k = int(floor(z / threshold))
+
+        #Anything within threshold is in one of the neighbouring cells
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                for dk in (-1, 0, 1):
+                    for u in cells.get((i+di, j+dj, k+dk), ()):
+                        dx = coords[3*u] - x
+                        dy = coords[3*u+1] - y
+                        dz = coords[3*u+2] - z
+                        if dx*dx + dy*dy + dz*dz <= limit:
+                            union(parent, u, v)
+
+        cell = (i, j, k)
+        if cell in cells:
+            cells[cell].append(v)
+        else:
+            cells[cell] = [v]
+
+    #Roots come before the rest of their group, so one pass numbers them
+    remap = array('i', [0]) * count
+    groups = 0
+    for v in range(count):
+        root = findRoot(parent, v)
+        if root == v:
+            remap[v] = groups
+            groups += 1
+        else:
+            remap[v] = remap[root]
+
+    return remap, groups
+
+
+def weldFaces(remap, loops, loopStart, loopTotal):
+    """Remap face loops, dropping faces that collapse
+
+    Repeated neighbours in a loop become one corner. A face is dropped if it
+    has fewer than three corners left, or visits a vertex twice"""
+    mapped = array('i', [remap[v] for v in loops])
+
+    #Most faces keep all their corners, and can be copied over whole
+    faces = list(zip(loopStart, loopTotal))
+    if all(len(set(mapped[start:start+total])) == total for start, total in faces):
+        return mapped, array('i', loopStart), array('i', loopTotal)
+
+    newLoops = array('i')
+    newStart = array('i')
+    newTotal = array('i')
+
+    for start, total in faces:
+        face = []
+        for v in mapped[start:start+total]:
+            if not face or face[-1] != v:
+                face.append(v)
+        while len(face) > 1 and face[0] == face[-1]:
+            face.pop()
+
+        if len(face) < 3 or len(set(face)) != len(face):
+            continue
+
+        newStart.append(len(newLoops))
+        newTotal.append(len(face))
+        newLoops.extend(face)
+
+    return newLoops, newStart, newTotal
+
+
+def weld(coords, loops, loopStart, loopTotal, threshold, candidates=None):
+    """Weld a mesh given as flat arrays
+
+    Returns the welded (coords, loops, loopStart, loopTotal), where each
+    merged vertex takes the position of the lowest vertex it was merged with"""
+    remap, groups = weldMap(coords, threshold, candidates)
+
+    #Each group is first seen at its root
+    newCoords = array(getattr(coords, "typecode", 'd'))
+    for v in range(len(remap)):
+        if remap[v] == len(newCoords) // 3:
+            newCoords.extend(coords[3*v:3*v+3])
+
+    return (newCoords,) + weldFaces(remap, loops, loopStart, loopTotal)
+
+
+if __name__ == "__main__":
+    #Benchmark on a noisy grid, where every vertex has a near double
+    from random import Random
+    rand = Random(0)
+
+    size = 200
+    coords = array('d')
+    for copy in range(2):
+        for i in range(size):
+            for j in range(size):
+                coords.extend((i * 0.01 + rand.uniform(-0.0002, 0.0002),
+                               j * 0.01 + rand.uniform(-0.0002, 0.0002),
+                               0.0))
+
+    loops = array('i')
+    loopStart = array('i')
+    loopTotal = array('i')
+    for copy in range(2):
+        base = copy * size * size
+        for i in range(size-1):
+            for j in range(size-1):
+                loopStart.append(len(loops))
+                loopTotal.append(4)
+                loops.extend((base + i*size + j, base + (i+1)*size + j,
+                              base + (i+1)*size + j+1, base + i*size + j+1))
+
+    start = time()
+    welded = weld(coords, loops, loopStart, loopTotal, 0.001)
+    print(len(coords) // 3, "verts ->", len(welded[0]) // 3, "verts,",
+          len(loopStart), "faces ->", len(welded[2]), "faces in",
+          round(time() - start, 3), "s")
@@ -0,0 +1,41 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+bl_info = {
+    "name": "Shadow Sketch Alpha",
+    "author": "Peter Andrien, Gary Lent",
+    "version": (0,1),
+    "blender": (2, 5, 9),
+    "api": 39307,
+    "location": "View3D > Tools > Parameteriz Object",
+    "description": "Creates Meshes Using Silhouette, based on the 2010 sigraph paper.",
+    "warning": "",
+    "wiki_url": "",
+    "tracker_url": "",
+    "category": "Mesh"}
+
+#The addon is a package so Kernel and Weld are installed along with it,
+#under its name rather than as top level modules of their own
+try:
+    import bpy
+except ImportError:
+    #Kernel and Weld don't need Blender, and can still be imported
+    bpy = None
+
+if bpy:
+    from .ShadowShapes_0_2 import register, unregister
@@ -3,6 +3,8 @@
 #Circular Interpolation doesn't handle reference values properly
 
 #=== Some Useful Helper Functions ===:
+from array import array
+from mathutils import Vector
 
 # ---- Properties ----
 def setProp(propName, data, object=None):
@@ -166,31 +168,42 @@ def isMesh(ob):
     return ob.type == "MESH"
 
 
+def meshCoords(me):
+    "Every vertex coordinate of mesh me, flat as x, y, z, read in one foreach_get"
+    coords = array('f', [0.0]) * (3*len(me.vertices))
+    me.vertices.foreach_get("co", coords)
+    return coords
+
+
+def meshEdges(me):
+    "The vertex pair of every edge of mesh me, flat, read in one foreach_get"
+    edges = array('i', [0]) * (2*len(me.edges))
+    me.edges.foreach_get("vertices", edges)
+    return edges
+
+
 def findVerts(ob):
     "Return a list of vertex coordinates"
-    list = []
-    for v in ob.data.vertices:
-        list.append([v.co[0],v.co[1],v.co[2]])
-    return list
+    coords = meshCoords(ob.data)
+    return [coords[k:k+3].tolist() for k in range(0, len(coords), 3)]
 
 
 def getVertsAndVertConnections(ob):
     "Return a list vertex coordinates and connected vertex coordinates"
-    listVerts = []
+    coords = meshCoords(ob.data)
+    edges = meshEdges(ob.data)
+    verts = [Vector(coords[k:k+3]) for k in range(0, len(coords), 3)]
     
-    for vert in ob.data.vertices:
-        
-        listConnections = []
-        
-        for edge in ob.data.edges:
-            if vert.index in edge.vertices:
-                for edgeVertIndex in edge.vertices:
-                    if edgeVertIndex != vert.index:
-                        listConnections.append(ob.data.vertices[edgeVertIndex].co)
-            
-        listVerts.append([vert.co, listConnections])
-
-    return listVerts
+    #Each edge connects its two ends, in edge order
+    connections = [[] for vert in verts]
+    for k in range(0, len(edges), 2):
+        a = edges[k]
+        b = edges[k+1]
+        if a != b:
+            connections[a].append(verts[b])
+            connections[b].append(verts[a])
+
+    return [[verts[i], connections[i]] for i in range(len(verts))]
 
 
 def setVert(position,vert,default=[0,0,0]):
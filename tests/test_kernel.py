@@ -0,0 +1,226 @@
+#=== Kernel Tests ===
+#Run with python -m unittest discover tests. Kernel needs no Blender, so
+#these run anywhere. The getGeometry digests were recorded from the
+#original ShadowShapes getGeometry, run on the same silhouettes.
+
+import os
+import sys
+import unittest
+from array import array
+from collections import Counter
+from hashlib import sha1
+from math import cos, sin, pi
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from ShadowShapes import Kernel
+from ShadowShapes.Kernel import GeometryBuilder, GridState, MeshBuffers, Silhouette, orientFaces
+
+
+def outline(*loops):
+    "Coords and edges of closed loops of (x, y) points, as Blender reads them"
+    coords = []
+    edges = []
+    for points in loops:
+        base = len(coords)
+        for k in range(len(points)):
+            coords.append(tuple(array('f', points[k])))
+            edges.append((base + k, base + (k+1) % len(points)))
+    return coords, edges
+
+def ngon(n, r, rot=0.0):
+    return [(r*cos(rot + 2*pi*k/n), r*sin(rot + 2*pi*k/n)) for k in range(n)]
+
+SHAPES = {
+    "square": outline([(0, 0), (2, 0), (2, 2), (0, 2)]),
+    "triangle": outline([(0.5, 0), (2.5, 0), (1.5, 2)]),
+    "lshape": outline([(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)]),
+    "notch": outline([(0, 0), (3, 0), (3, 3), (1.5, 1.5), (0, 3)]),
+    "ring": outline([(0, 0), (3, 0), (3, 3), (0, 3)], [(1, 1), (1, 2), (2, 2), (2, 1)]),
+    "octagon": outline(ngon(8, 1.0, 0.2)),
+    "heptagon": outline(ngon(7, 1.1, 0.05)),
+}
+
+#(x silhouette, y silhouette) -> (verts, faces, digest of the faces)
+BASELINE = {
+    ('square', 'triangle'): (14, 12, "1a544667036eec8610404135bf70ec0bd5495e78"),
+    ('triangle', 'square'): (16, 28, "e70658453e6e5f8f94a5d14ef69c01a9c5bb6244"),
+    ('square', 'lshape'): (20, 24, "63d3e011a251561a958bd96b3b797cda800464fa"),
+    ('lshape', 'square'): (31, 24, "b8dadca369e520005052481a78dec8cdd95f1e82"),
+    ('lshape', 'triangle'): (35, 42, "bf13bc8e13528e2c8d658b0c5caa5a600a5ed152"),
+    ('notch', 'ring'): (76, 72, "48d8261f9470cbdb6dcdc593385ae1236f88b0f0"),
+    ('ring', 'notch'): (104, 114, "ddd8395870ff9115af128f43058351099a128db9"),
+    ('octagon', 'heptagon'): (293, 333, "0b73a37977effb626dc4305b5e447693123d9046"),
+    ('heptagon', 'octagon'): (244, 254, "08bf00fcaf51bb9054b90ad6dc45e7c18ed27f91"),
+}
+
+def silhouette(name):
+    coords, edges = SHAPES[name]
+    return Silhouette(name, coords, edges)
+
+def faceDigest(verts, faces):
+    "Faces by the rounded positions of their corners, whatever the vertex order"
+    counts = Counter()
+    for face in faces:
+        corners = [tuple(round(c, 5) + 0.0 for c in verts[v]) for v in face]
+        first = corners.index(min(corners))
+        counts[tuple(corners[first:] + corners[:first])] += 1
+    return sha1(repr(sorted(counts.items())).encode()).hexdigest()
+
+def signedVolume(mesh):
+    coords = mesh.coords
+    volume = 0.0
+    for face in mesh.faces():
+        x0, y0, z0 = coords[3*face[0]:3*face[0]+3]
+        for k in range(1, len(face)-1):
+            x1, y1, z1 = coords[3*face[k]:3*face[k]+3]
+            x2, y2, z2 = coords[3*face[k+1]:3*face[k+1]+3]
+            volume += x0*(y1*z2 - z1*y2) + y0*(z1*x2 - x1*z2) + z0*(x1*y2 - y1*x2)
+    return volume
+
+def cube(flipped=()):
+    "A unit cube offset from the origin, with the faces in flipped wound inward"
+    mesh = MeshBuffers()
+    mesh.addVerts(array('d', [c + 1.0 for x in (0, 1) for y in (0, 1) for z in (0, 1)
+                              for c in (x, y, z)]))
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    for f in range(len(faces)):
+        face = faces[f]
+        if f in flipped:
+            face = face[::-1]
+        mesh.addFace(face)
+    return mesh
+
+
+class GetGeometryTest(unittest.TestCase):
+    def testMatchesBaseline(self):
+        for (x, y), (verts, faces, digest) in sorted(BASELINE.items()):
+            mesh, edges = GeometryBuilder().getGeometry(silhouette(x), silhouette(y))
+            self.assertEqual((mesh.vertCount(), mesh.faceCount()), (verts, faces), (x, y))
+            self.assertEqual(faceDigest(mesh.verts(), mesh.faces()), digest, (x, y))
+
+    def testEdgesDoNotChangeFaces(self):
+        for x, y in BASELINE:
+            withEdges = GeometryBuilder().getGeometry(silhouette(x), silhouette(y))[0]
+            mesh, edges = GeometryBuilder().getGeometry(silhouette(x), silhouette(y),
+                                                        withEdges=False)
+            self.assertEqual(edges, None)
+            self.assertEqual((mesh.coords, mesh.loops), (withEdges.coords, withEdges.loops))
+
+    def testReusedStateMatchesFreshBuild(self):
+        state = GridState()
+        for x, y in sorted(BASELINE):
+            reused = GeometryBuilder().getGeometry(silhouette(x), silhouette(y), state)[0]
+            fresh = GeometryBuilder().getGeometry(silhouette(x), silhouette(y))[0]
+            self.assertEqual((reused.coords, reused.loops), (fresh.coords, fresh.loops))
+
+    def testMovedVertexOnlyRebuildsItsBands(self):
+        other = outline(ngon(45, 0.9, 0.03))
+        points = ngon(60, 1.0, 0.01)
+        state = GridState()
+        GeometryBuilder().getGeometry(Silhouette("x", *outline(points)),
+                                      Silhouette("y", *other), state)
+
+        #Moving a vertex adds a row across every column it is inside of
+        x, y = points[7]
+        points[7] = (x * 1.02, y * 1.02)
+        moved = Silhouette("x", *outline(points))
+        reused = GeometryBuilder().getGeometry(moved, Silhouette("y", *other), state)[0]
+        self.assertGreater(state.reused, 3 * state.built)
+
+        fresh = GeometryBuilder().getGeometry(moved, Silhouette("y", *other))[0]
+        self.assertEqual((reused.coords, reused.loops), (fresh.coords, fresh.loops))
+
+    def testSilhouettesSharingAName(self):
+        square = Silhouette("s", *SHAPES["square"])
+        triangle = Silhouette("s", *SHAPES["triangle"])
+        mesh = GeometryBuilder().getGeometry(square, triangle)[0]
+        expected = GeometryBuilder().getGeometry(silhouette("square"), silhouette("triangle"))[0]
+        self.assertEqual((mesh.coords, mesh.loops), (expected.coords, expected.loops))
+
+
+class OrientFacesTest(unittest.TestCase):
+    def testFlippedFacesTurnOutward(self):
+        for flipped in ((), (0,), (1, 3), (0, 2, 4), (0, 1, 2, 3, 4, 5)):
+            mesh = cube(flipped)
+            oriented = mesh.oriented()
+            self.assertEqual(oriented.faces(), cube().faces())
+            self.assertGreater(signedVolume(oriented), 0)
+
+    def testEveryEdgeRunsBothWays(self):
+        mesh = cube((2, 5)).oriented()
+        directed = Counter()
+        for face in mesh.faces():
+            for k in range(len(face)):
+                directed[(face[k], face[(k+1) % len(face)])] += 1
+        self.assertEqual(len(directed), 24)
+        for a, b in directed:
+            self.assertIn((b, a), directed)
+
+    def testPatchesAreOrientedApart(self):
+        #Two cubes that share no edges, one turned inside out
+        mesh = cube()
+        other = cube((0, 1, 2, 3, 4, 5))
+        other.coords = array('f', [c + 3.0 for c in other.coords])
+        mesh.extend(other)
+        loops = orientFaces(mesh.coords, mesh.loops, mesh.loopStart, mesh.loopTotal)
+        self.assertEqual(loops[:24], cube().loops)
+        self.assertEqual(loops[24:], array('i', [v + 8 for v in cube().loops]))
+
+    def testEdgeSharedByThreeFaces(self):
+        #A fin on one edge of a cube is a patch of its own, the cube still turns outward
+        for tip, fin in [(tip, fin) for tip in ((0, 2), (2, 0)) for fin in ((0, 1, 8), (1, 0, 8))]:
+            mesh = cube((1, 2))
+            mesh.addVerts(array('d', tip + (1.5,)))
+            mesh.addFace(fin)
+            oriented = mesh.oriented()
+            self.assertEqual(oriented.faces()[:6], cube().faces())
+            
+            finMesh = MeshBuffers()
+            finMesh.addVerts(oriented.coords)
+            finMesh.addFace(oriented.faces()[6])
+            self.assertGreater(signedVolume(finMesh), 0)
+
+
+class GenerateSurfacesTest(unittest.TestCase):
+    def testSerialAndConcurrentAgree(self):
+        x = silhouette("octagon")
+        y = silhouette("heptagon")
+        serial = Kernel.generateSurfaces(x, y, x, "Serial")
+        concurrent = Kernel.generateSurfaces(x, y, x, "Concurrent", workers=2, concurrent=True)
+        Kernel.closeWorkerPools()
+        self.assertEqual([suffix for suffix, mesh in serial], ["Surface", "Surface3"])
+        self.assertEqual([(suffix, mesh.coords, mesh.loops) for suffix, mesh in serial],
+                         [(suffix, mesh.coords, mesh.loops) for suffix, mesh in concurrent])
+
+    def testTwoFaceEdgesRunBothWays(self):
+        names = sorted(SHAPES)
+        for x, y in [(x, y) for x in names for y in names if x != y]:
+            for suffix, mesh in Kernel.generateSurfaces(silhouette(x), silhouette(y),
+                                                        silhouette(x), "Wound"):
+                directed = Counter()
+                for face in mesh.faces():
+                    for k in range(len(face)):
+                        directed[(face[k], face[(k+1) % len(face)])] += 1
+                undirected = Counter()
+                for a, b in directed:
+                    undirected[min(a, b), max(a, b)] += directed[a, b]
+                for (a, b), count in undirected.items():
+                    if count == 2:
+                        self.assertEqual(directed[a, b], 1, (x, y, suffix, a, b))
+        Kernel.dropGridStates("Wound")
+
+    def testGridStatesArePruned(self):
+        x = silhouette("square")
+        y = silhouette("lshape")
+        Kernel.generateSurfaces(x, y, None, "Kept")
+        Kernel.generateSurfaces(x, y, None, "Dropped")
+        self.assertGreater(Kernel.gridStateBytes("Kept"), 0)
+
+        Kernel.pruneGridStates(["Kept"])
+        self.assertEqual(sorted(Kernel.gridStates), ["KeptSurface", "KeptSurface2"])
+        Kernel.dropGridStates("Kept")
+        self.assertEqual(Kernel.gridStates, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#=== Weld Tests ===
+#Run with python -m unittest discover tests
+
+import os
+import sys
+import unittest
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from ShadowShapes.Weld import weld, weldCandidates, weldFaces, weldMap
+
+
+def grid(size, step, offset=0.0):
+    "Flat coords of a size by size grid of points in the z = 0 plane"
+    coords = array('d')
+    for i in range(size):
+        for j in range(size):
+            coords.extend((i*step + offset, j*step + offset, 0.0))
+    return coords
+
+def bruteWeldMap(coords, threshold):
+    "weldMap by comparing every pair, for checking against"
+    count = len(coords) // 3
+    group = list(range(count))
+    for a in range(count):
+        for b in range(a):
+            d = sum((coords[3*a+k] - coords[3*b+k])**2 for k in range(3))
+            if d <= threshold*threshold:
+                old, new = max(group[a], group[b]), min(group[a], group[b])
+                group = [new if g == old else g for g in group]
+    roots = sorted(set(group))
+    return array('i', [roots.index(g) for g in group]), len(roots)
+
+
+class WeldMapTest(unittest.TestCase):
+    def testMergesNearDoubles(self):
+        coords = array('d', [0, 0, 0, 1, 0, 0, 0.0005, 0, 0, 1, 0.0009, 0, 2, 0, 0])
+        remap, groups = weldMap(coords, 0.001)
+        self.assertEqual(list(remap), [0, 1, 0, 1, 2])
+        self.assertEqual(groups, 3)
+
+    def testMatchesBruteForce(self):
+        #Two offset grids, so each point has a near double across cell borders
+        coords = grid(6, 0.01)
+        coords.extend(grid(6, 0.01, 0.0007))
+        coords.extend(array('d', [0.0305, 0.0305, 0.0]))
+        for threshold in (0.0005, 0.001, 0.011):
+            self.assertEqual(weldMap(coords, threshold), bruteWeldMap(coords, threshold))
+
+    def testChainsMergeThroughUnion(self):
+        #Neighbours are each within threshold, the ends are not
+        coords = array('d', [0, 0, 0, 0.0008, 0, 0, 0.0016, 0, 0])
+        remap, groups = weldMap(coords, 0.001)
+        self.assertEqual((list(remap), groups), ([0, 0, 0], 1))
+
+    def testCandidatesCoverEveryDouble(self):
+        coords = grid(5, 0.01)
+        coords.extend(array('d', [0.0203, 0.0199, 0.0, 0.5, 0.5, 0.5]))
+        candidates = weldCandidates(coords, 0.001)
+        self.assertIn(12, candidates)
+        self.assertIn(25, candidates)
+        self.assertNotIn(26, candidates)
+        self.assertEqual(weldMap(coords, 0.001, candidates), weldMap(coords, 0.001))
+
+
+class WeldFacesTest(unittest.TestCase):
+    def testUntouchedFacesAreCopied(self):
+        loops = array('i', [0, 1, 2, 2, 1, 3])
+        remap = array('i', [0, 1, 2, 3])
+        self.assertEqual(weldFaces(remap, loops, array('i', [0, 3]), array('i', [3, 3])),
+                         (loops, array('i', [0, 3]), array('i', [3, 3])))
+
+    def testCollapsedFacesAreDropped(self):
+        #A quad losing one corner, a triangle losing two, and a bow tie
+        loops = array('i', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 8, 10])
+        remap = array('i', [0, 1, 1, 2, 3, 3, 3, 4, 5, 6, 7])
+        loops, loopStart, loopTotal = weldFaces(remap, loops, array('i', [0, 4, 7]),
+                                                array('i', [4, 3, 5]))
+        self.assertEqual(list(loops), [0, 1, 2])
+        self.assertEqual((list(loopStart), list(loopTotal)), ([0], [3]))
+
+
+class WeldTest(unittest.TestCase):
+    def testTwoQuadsShareTheirEdge(self):
+        coords = array('f', [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0,
+                             1.0004, 0, 0, 2, 0, 0, 2, 1, 0, 1, 1.0004, 0])
+        loops = array('i', [0, 1, 2, 3, 4, 5, 6, 7])
+        coords, loops, loopStart, loopTotal = weld(coords, loops, array('i', [0, 4]),
+                                                   array('i', [4, 4]), 0.001)
+        self.assertEqual(coords.typecode, 'f')
+        self.assertEqual(len(coords) // 3, 6)
+        self.assertEqual(list(loops), [0, 1, 2, 3, 1, 4, 5, 2])
+        self.assertEqual((list(loopStart), list(loopTotal)), ([0, 4], [4, 4]))
+
+    def testMergedVertsKeepTheLowestPosition(self):
+        coords = array('d', [0.0005, 0, 0, 0, 0, 0, 1, 0, 0])
+        coords, loops, loopStart, loopTotal = weld(coords, array('i'), array('i'),
+                                                   array('i'), 0.001)
+        self.assertEqual(list(coords), [0.0005, 0, 0, 1, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()